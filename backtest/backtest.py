@@ -5,10 +5,13 @@ import argparse         # lets us read values like --ticker AAPL from the comman
 import importlib        # helps us load the strategy file chosen by the user
 import pandas as pd     # used for working with tables (like Excel in Python)
 import numpy as np      # used for math stuff
-import matplotlib.pyplot as plt  # used for plotting graphs
-from scipy import stats
 from datetime import datetime, date
 import os              # for working with file paths
+import hashlib         # fingerprints price data for the strategy-output cache
+from collections import OrderedDict  # remembers recent strategy outputs, least recently used first
+from concurrent.futures import ProcessPoolExecutor, as_completed  # runs several backtests at once
+from dataclasses import dataclass  # for small containers of related values
+from functools import cached_property  # computes a value on first use, then keeps it
 
 # We import our custom function from the utils folder
 from utils import get_data
@@ -19,86 +22,280 @@ try:
 except ImportError:
     strategy_metadata = {}
 
+# Column names for the monthly returns table (month number 1-12 -> abbreviation)
+_MONTH_ABBR = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+# numba is optional - without it we fall back to the NumPy trade pairing below
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# numexpr is optional too - on very long series it fuses the return/drawdown
+# arithmetic into one multithreaded pass without NumPy's temporary arrays
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+# Below this many bars plain NumPy wins (numexpr has a fixed start-up cost)
+_NUMEXPR_MIN_SIZE = 200_000
+
+# -----------------------------------------------------
+# The strategy output columns the metrics and chart actually use
+# -----------------------------------------------------
+@dataclass
+class BacktestArrays:
+    """Date, Close, Signal and EquityCurve of a strategy's output as plain NumPy arrays.
+
+    Pulled out of the strategy DataFrame once so the metrics and the chart don't
+    go through pandas (or drag the indicator columns along) for every access.
+    """
+    date: np.ndarray
+    close: np.ndarray
+    signal: np.ndarray
+    equity: np.ndarray
+    is_short: bool = None  # None = unknown, guess from the signals when plotting
+
+    @classmethod
+    def from_df(cls, df):
+        """Build from a strategy DataFrame with Date, Close, Signal and EquityCurve columns."""
+        return cls(
+            date=df["Date"].to_numpy(),
+            close=df["Close"].to_numpy(dtype=np.float64),
+            signal=df["Signal"].to_numpy(),
+            equity=df["EquityCurve"].to_numpy(),
+            is_short=df.attrs.get('is_short_strategy'),
+        )
+
+    @cached_property
+    def drawdown(self):
+        """Daily drawdown from the running peak - computed on first use, then shared
+        by the metrics and the chart."""
+        return _drawdown(self.equity)[0]
+
+    @cached_property
+    def max_drawdown(self):
+        """Worst daily drawdown (a negative fraction)."""
+        return self.drawdown.min()
+
+# -----------------------------------------------------
+# These functions turn the Signal column into completed trades
+# -----------------------------------------------------
+def _walk_trades(sig, px, is_short):
+    """Walk the signals bar by bar and return (entry_idx, exit_idx, entry_px, exit_px).
+
+    Long: 1 = buy, -1 = sell. Short: -1 = enter short, 1 = cover.
+    Written as a plain loop over arrays so numba can compile it.
+    """
+    entry_signal = -1 if is_short else 1
+    exit_signal = -entry_signal
+
+    # Every trade needs its own entry bar and exit bar, so this is an upper bound
+    max_trades = len(sig) // 2 + 1
+    entry_idx = np.empty(max_trades, dtype=np.int64)
+    exit_idx = np.empty(max_trades, dtype=np.int64)
+    n_trades = 0
+    in_position = False
+
+    for i in range(len(sig)):
+        if not in_position:
+            if sig[i] == entry_signal:
+                entry_idx[n_trades] = i
+                in_position = True
+        elif sig[i] == exit_signal:
+            exit_idx[n_trades] = i
+            n_trades += 1
+            in_position = False
+
+    entry_idx = entry_idx[:n_trades]
+    exit_idx = exit_idx[:n_trades]
+    return entry_idx, exit_idx, px[entry_idx], px[exit_idx]
+
+
+def _pair_trades(sig, px, is_short):
+    """Vectorized version of _walk_trades for when numba isn't installed."""
+    entry_signal, exit_signal = (-1, 1) if is_short else (1, -1)
+    ei = np.flatnonzero(sig == entry_signal)
+    xi = np.flatnonzero(sig == exit_signal)
+
+    # Pair every entry with the first exit after it. Entries that fire while a
+    # position is already open map to the same exit, so only the first one counts.
+    # Entries with no later exit are still-open positions and are dropped.
+    next_exit = np.searchsorted(xi, ei, side="right")
+    has_exit = next_exit < len(xi)
+    ei, next_exit = ei[has_exit], next_exit[has_exit]
+    next_exit, first = np.unique(next_exit, return_index=True)
+    ei, xi = ei[first], xi[next_exit]
+    return ei, xi, px[ei], px[xi]
+
+
+_find_trades = njit(cache=True)(_walk_trades) if njit is not None else _pair_trades
+
+
+def _compound_loop(returns, starts):
+    """Compounded return of each run returns[starts[k]:starts[k + 1]] (the last run goes to the end).
+
+    Written as a plain loop over arrays so numba can compile it.
+    """
+    n_runs = len(starts)
+    out = np.empty(n_runs)
+    for k in range(n_runs):
+        stop = starts[k + 1] if k + 1 < n_runs else len(returns)
+        growth = 1.0
+        for i in range(starts[k], stop):
+            growth *= 1.0 + returns[i]
+        out[k] = growth - 1.0
+    return out
+
+
+def _compound_log(returns, starts):
+    """Vectorized version of _compound_loop for when numba isn't installed.
+
+    (1+r1)*(1+r2)*... - 1 == expm1(log1p(r1) + log1p(r2) + ...), so each run is one reduceat sum.
+    """
+    if len(starts) == 0:
+        return np.empty(0)
+    return np.expm1(np.add.reduceat(np.log1p(returns), starts))
+
+
+_compound_runs = njit(cache=True)(_compound_loop) if njit is not None else _compound_log
+
+
+def _run_starts(keys):
+    """Index of the first element of each run of equal consecutive keys."""
+    change = np.ones(len(keys), dtype=bool)
+    change[1:] = keys[1:] != keys[:-1]
+    return np.flatnonzero(change)
+
+
+def _daily_returns(values):
+    """Simple bar-to-bar returns of a price/equity array, with 0 on the first bar.
+
+    Float input keeps its dtype (float32 equity stays float32); anything else becomes float64.
+    """
+    values = np.asarray(values)
+    if not np.issubdtype(values.dtype, np.floating):
+        values = values.astype(np.float64)
+    returns = np.empty_like(values)
+    if len(values):
+        returns[0] = 0.0
+        if ne is not None and len(values) >= _NUMEXPR_MIN_SIZE:
+            returns[1:] = ne.evaluate("curr / prev - 1", local_dict={"curr": values[1:], "prev": values[:-1]})
+        else:
+            returns[1:] = values[1:] / values[:-1] - 1.0
+    return returns
+
+
+def _drawdown(equity):
+    """Return (drawdown array, max drawdown) for an equity curve, as fractions of the running peak."""
+    equity = np.asarray(equity)
+    if not np.issubdtype(equity.dtype, np.floating):
+        equity = equity.astype(np.float64)
+    return _drawdown_pass(equity)
+
+
+def _drawdown_loop(equity):
+    """Running peak, drawdown and its minimum in one pass over the curve (compiled with numba)."""
+    drawdown = np.empty_like(equity)
+    peak = equity[0]
+    worst = equity[0] - equity[0]
+    for i in range(len(equity)):
+        if equity[i] > peak:
+            peak = equity[i]
+        drawdown[i] = (equity[i] - peak) / peak
+        if drawdown[i] < worst:
+            worst = drawdown[i]
+    return drawdown, worst
+
+
+def _drawdown_numpy(equity):
+    """Vectorized version of _drawdown_loop for when numba isn't installed."""
+    peak = np.maximum.accumulate(equity)
+    if ne is not None and len(equity) >= _NUMEXPR_MIN_SIZE:
+        drawdown = ne.evaluate("(equity - peak) / peak")
+    else:
+        drawdown = equity - peak
+        drawdown /= peak  # in place: one temporary instead of two
+    return drawdown, drawdown.min()
+
+
+_drawdown_pass = njit(cache=True)(_drawdown_loop) if njit is not None else _drawdown_numpy
+
 # -----------------------------------------------------
 # This function calculates all the stats like return, Sharpe ratio, etc.
 # -----------------------------------------------------
-def calculate_metrics(df, strategy_name=None):
-    """Calculate comprehensive trading performance metrics."""
+def calculate_metrics(arrays, strategy_name=None):
+    """Calculate comprehensive trading performance metrics.
+
+    arrays is a BacktestArrays (a strategy DataFrame is converted automatically).
+    """
+    if isinstance(arrays, pd.DataFrame):
+        arrays = BacktestArrays.from_df(arrays)
+    signal = arrays.signal
+    close = arrays.close
+    equity = arrays.equity
+    dates = arrays.date
+    
     # First check if we have any signals at all
-    has_buy_signals = (df["Signal"] == 1).any()
-    has_sell_signals = (df["Signal"] == -1).any()
+    has_buy_signals = (signal == 1).any()
+    has_sell_signals = (signal == -1).any()
     
     if not has_buy_signals and not has_sell_signals:
         print("Warning: No signals found in the strategy output.")
         return None
     
     # Check if we have any signal changes
-    signal_changes = df["Signal"].diff().fillna(0)
-    entries = signal_changes[signal_changes == 1].index
-    exits = signal_changes[signal_changes == -2].index
+    # (the first bar has no previous signal, so its change counts as 0)
+    signal_changes = np.diff(signal, prepend=signal[:1])
+    entries = np.flatnonzero(signal_changes == 1)
+    exits = np.flatnonzero(signal_changes == -2)
     
     # This was causing false negatives - we need to directly check for actual -1 values
     # for sell signals, not just differences of -2
     if len(entries) == 0:
-        entries = df.index[df["Signal"] == 1]
+        entries = np.flatnonzero(signal == 1)
     
     if len(exits) == 0:
-        exits = df.index[df["Signal"] == -1]
+        exits = np.flatnonzero(signal == -1)
     
     if len(entries) == 0 and len(exits) == 0:
         print("Warning: No trades executed.")
         return None
 
     # Calculate total return from equity curve
-    start_equity = df["EquityCurve"].iloc[0]
-    end_equity = df["EquityCurve"].iloc[-1]
+    start_equity = equity[0]
+    end_equity = equity[-1]
     total_return = (end_equity / start_equity) - 1
     
     # Calculate trade stats
-    num_years = (df["Date"].iloc[-1] - df["Date"].iloc[0]).days / 365
+    num_years = pd.Timedelta(dates[-1] - dates[0]).days / 365
     cagr = (1 + total_return) ** (1 / num_years) - 1
     
     # Calculate Sharpe Ratio (daily returns)
-    df["Daily_Return"] = df["EquityCurve"].pct_change().fillna(0)
-    avg_daily_return = df["Daily_Return"].mean()
-    daily_std = df["Daily_Return"].std()
+    daily_returns = _daily_returns(equity)
+    avg_daily_return = daily_returns.mean()
+    daily_std = daily_returns.astype(np.float64).std(ddof=1)  # sample std, same as pandas
     sharpe_ratio = np.sqrt(252) * avg_daily_return / daily_std
     
-    # Calculate daily max drawdown
-    df["Peak"] = df["EquityCurve"].cummax()
-    df["Drawdown"] = (df["EquityCurve"] - df["Peak"]) / df["Peak"]
-    daily_max_drawdown = df["Drawdown"].min()
+    # Calculate daily max drawdown (cached on arrays, so the chart reuses it)
+    daily_max_drawdown = arrays.max_drawdown
     
     # Calculate monthly max drawdown using STRICTLY month-end equity values
     try:
-        # Make a copy to avoid modifying the original dataframe
-        df_copy = df.copy()
-        
         # Ensure Date is datetime
-        if not pd.api.types.is_datetime64_any_dtype(df_copy['Date']):
-            df_copy['Date'] = pd.to_datetime(df_copy['Date'])
-        
-        # Create a month identifier column
-        df_copy['YearMonth'] = df_copy['Date'].dt.to_period('M')
+        if not np.issubdtype(dates.dtype, np.datetime64):
+            dates = pd.to_datetime(dates).to_numpy()
         
-        # For each month, find the last trading day
-        last_days = df_copy.groupby('YearMonth')['Date'].max().reset_index()
-        
-        # Get total number of days and months in the dataset
-        total_days = len(df_copy)
-        total_months = len(last_days)
-        
-        # Only keep the end-of-month trading days
-        monthly_df = pd.merge(df_copy, last_days, on=['YearMonth', 'Date'], how='inner')[['Date', 'EquityCurve']]
-        
-        # Sort by date to ensure proper calculation
-        monthly_df = monthly_df.sort_values('Date')
+        # The last trading day of each month is the last bar before the month changes
+        # (rows are in date order), so the month-end rows fall straight out of the array
+        months = dates.astype("datetime64[M]")
+        last_days = np.flatnonzero(np.append(months[1:] != months[:-1], True))
+        month_end_equity = equity[last_days]
         
         # Only calculate monthly drawdown if we have at least 2 months of data
-        if len(monthly_df) > 2:  # Need at least 3 months for a meaningful monthly drawdown
-            monthly_df['Peak'] = monthly_df['EquityCurve'].cummax()
-            monthly_df['Drawdown'] = (monthly_df['EquityCurve'] - monthly_df['Peak']) / monthly_df['Peak']
-            monthly_max_drawdown = monthly_df['Drawdown'].min()
+        if len(month_end_equity) > 2:  # Need at least 3 months for a meaningful monthly drawdown
+            monthly_max_drawdown = _drawdown(month_end_equity)[1]
             
             # Make sure monthly drawdown is never worse than daily drawdown
             # (this is mathematically impossible unless there's a calculation error)
@@ -122,61 +319,26 @@ def calculate_metrics(df, strategy_name=None):
     max_daily_drawdown = daily_max_drawdown  # This ensures daily drawdown can't be worse than overall drawdown
     
     # Calculate win rate and profit factor
-    trades = []
-    position = 0  # 0 = no position, 1 = long, -1 = short
-    entry_price = 0
-    entry_date = None
-    
     # Check if this is a short strategy by name only
     is_short_strategy = False
     if strategy_name and ("short" in strategy_name.lower()):
         is_short_strategy = True
         print("Detected short strategy from strategy name")
-    
-    for i in range(len(df)):
-        curr_signal = df["Signal"].iloc[i]
-        curr_price = df["Close"].iloc[i]
-        curr_date = df["Date"].iloc[i]
-        
-        # Long strategy logic (signal 1 = buy, -1 = sell)
-        if not is_short_strategy:
-            if curr_signal == 1 and position == 0:  # Enter long
-                position = 1
-                entry_price = curr_price
-                entry_date = curr_date
-            elif curr_signal == -1 and position == 1:  # Exit long
-                position = 0
-                exit_price = curr_price
-                exit_date = curr_date
-                trades.append({
-                    "Entry Date": entry_date,
-                    "Exit Date": exit_date,
-                    "Entry Price": entry_price,
-                    "Exit Price": exit_price,
-                    "Type": "Long",
-                    "Return %": (exit_price - entry_price) / entry_price * 100
-                })
-                
-        # Short strategy logic (signal -1 = enter short, 1 = cover)
-        else:
-            if curr_signal == -1 and position == 0:  # Enter short
-                position = -1
-                entry_price = curr_price
-                entry_date = curr_date
-            elif curr_signal == 1 and position == -1:  # Cover short
-                position = 0
-                exit_price = curr_price
-                exit_date = curr_date
-                trades.append({
-                    "Entry Date": entry_date,
-                    "Exit Date": exit_date,
-                    "Entry Price": entry_price,
-                    "Exit Price": exit_price,
-                    "Type": "Short",
-                    "Return %": (entry_price - exit_price) / entry_price * 100  # Short return calculation
-                })
-    
-    trades_df = pd.DataFrame(trades)
+
+    ei, xi, entry_price, exit_price = _find_trades(signal.astype(np.int8), close, is_short_strategy)
+    if is_short_strategy:
+        trade_returns = (entry_price - exit_price) / entry_price * 100  # Short return calculation
+    else:
+        trade_returns = (exit_price - entry_price) / entry_price * 100
+
+    trades_df = pd.DataFrame({
+        "Entry Date": dates[ei],
+        "Exit Date": dates[xi],
+        "Entry Price": entry_price,
+        "Exit Price": exit_price,
+        "Type": "Short" if is_short_strategy else "Long",
+        "Return %": trade_returns,
+    }) if len(ei) else pd.DataFrame()
     
     # Handle edge case where no trades were completed (we had signals but not complete trades)
     if len(trades_df) == 0:
@@ -203,38 +365,37 @@ def calculate_metrics(df, strategy_name=None):
         print("Warning: No complete trades found.")
         return None
         
-    win_rate = (trades_df["Return %"] > 0).mean()
-    profits = trades_df[trades_df["Return %"] > 0]["Return %"].sum()
-    losses = abs(trades_df[trades_df["Return %"] < 0]["Return %"].sum())
+    # Split winners and losers once and reuse the masks for every stat
+    win_mask = trade_returns > 0
+    loss_mask = trade_returns < 0
+    wins = trade_returns[win_mask]
+    losers = trade_returns[loss_mask]
+    
+    win_rate = win_mask.mean()
+    profits = wins.sum()
+    losses = abs(losers.sum())
     profit_factor = profits / losses if losses != 0 else float('inf')
     
     # Calculate average trade metrics
-    avg_trade = trades_df["Return %"].mean()
-    avg_win = trades_df[trades_df["Return %"] > 0]["Return %"].mean() if len(trades_df[trades_df["Return %"] > 0]) > 0 else 0
-    avg_loss = trades_df[trades_df["Return %"] < 0]["Return %"].mean() if len(trades_df[trades_df["Return %"] < 0]) > 0 else 0
+    avg_trade = trade_returns.mean()
+    avg_win = wins.mean() if len(wins) > 0 else 0
+    avg_loss = losers.mean() if len(losers) > 0 else 0
     
     # Calculate Time Active
     # Time Active is the percentage of days the strategy was invested in the market
     if is_short_strategy:
         # For short strategies, count days where we're in a short position
         # We need to track this because Signal==1 means "cover short" not "in short"
-        is_active = np.zeros(len(df), dtype=bool)
-        in_short = False
-        
-        for i in range(len(df)):
-            if df["Signal"].iloc[i] == -1:  # Enter short signal
-                in_short = True
-            elif df["Signal"].iloc[i] == 1:  # Cover short signal
-                in_short = False
-            
-            is_active[i] = in_short
-            
-        days_in_market = is_active.sum()
+        # -1 (enter short) switches the state on, 1 (cover) switches it off, and
+        # every other bar carries the last state forward
+        state = np.where(signal == -1, 1.0, np.where(signal == 1, 0.0, np.nan))
+        is_active = pd.Series(state).ffill().fillna(0).to_numpy().astype(bool)
+        days_in_market = np.count_nonzero(is_active)
     else:
         # For long strategies, count days with Signal==1 (in a long position)
-        days_in_market = (df["Signal"] == 1).sum()
+        days_in_market = np.count_nonzero(signal == 1)
         
-    total_days = len(df)
+    total_days = signal.size
     time_active_pct = days_in_market / total_days if total_days > 0 else 0
     
     # Add protection for division by zero or very small drawdowns
@@ -277,57 +438,64 @@ def calculate_metrics(df, strategy_name=None):
 # -----------------------------------------------------
 # This function draws the equity curve (like a performance chart)
 # -----------------------------------------------------
-def plot_equity_curve(df, show_plot=False):
-    """Plot equity curve with buy/sell markers and drawdown."""
+def plot_equity_curve(arrays, show_plot=False):
+    """Plot equity curve with buy/sell markers and drawdown.
+
+    arrays is a BacktestArrays (a strategy DataFrame is converted automatically).
+    """
+    # Imported here so metrics-only runs (CLI sweeps, worker processes) never load matplotlib
+    import matplotlib.pyplot as plt  # used for plotting graphs
+    
+    if isinstance(arrays, pd.DataFrame):
+        arrays = BacktestArrays.from_df(arrays)
+    sig = arrays.signal
+    dates = arrays.date
+    equity = arrays.equity
+    
     # Create figure with two subplots
     fig, (ax1, ax2) = plt.subplots(
         2, 1, figsize=(12, 8), gridspec_kw={'height_ratios': [3, 1]}
     )
 
     # -- Plot equity curve line --
-    ax1.plot(df["Date"], df["EquityCurve"], label="Equity Curve", linewidth=2)
+    ax1.plot(dates, equity, label="Equity Curve", linewidth=2)
 
-    # Detect if this is a short strategy (more -1 signals than 1 signals at the beginning)
-    first_signals = df["Signal"].replace(0, np.nan).dropna().head(10)
-    is_short_strategy = False
-    if len(first_signals) > 0 and (first_signals == -1).sum() > (first_signals == 1).sum():
-        is_short_strategy = True
+    # main() already flags short strategies on the DataFrame; only fall back to
+    # guessing from the signals (more -1 than 1 at the beginning) when it's missing
+    is_short_strategy = arrays.is_short
+    if is_short_strategy is None:
+        first_signals = sig[sig != 0][:10]
+        is_short_strategy = bool((first_signals == -1).sum() > (first_signals == 1).sum())
 
     # -- Find entry and exit points directly from Signal column --
     if is_short_strategy:
         # Short strategy: -1 = enter short, 1 = cover short
-        short_entry_mask = df["Signal"] == -1
-        short_exit_mask = df["Signal"] == 1
-        
-        entries = df.loc[short_entry_mask, ["Date", "EquityCurve"]]
-        exits = df.loc[short_exit_mask, ["Date", "EquityCurve"]]
+        short_entry_mask = sig == -1
+        short_exit_mask = sig == 1
         
-        if not entries.empty:
+        if short_entry_mask.any():
             ax1.scatter(
-                entries["Date"], entries["EquityCurve"],
+                dates[short_entry_mask], equity[short_entry_mask],
                 marker="v", color="red", s=100, label="Short Entry"
             )
-        if not exits.empty:
+        if short_exit_mask.any():
             ax1.scatter(
-                exits["Date"], exits["EquityCurve"],
+                dates[short_exit_mask], equity[short_exit_mask],
                 marker="^", color="green", s=100, label="Short Cover"
             )
     else:
         # Long strategy: 1 = buy, -1 = sell
-        buy_mask = df["Signal"] == 1
-        sell_mask = df["Signal"] == -1
+        buy_mask = sig == 1
+        sell_mask = sig == -1
         
-        buys = df.loc[buy_mask, ["Date", "EquityCurve"]]
-        sells = df.loc[sell_mask, ["Date", "EquityCurve"]]
-        
-        if not buys.empty:
+        if buy_mask.any():
             ax1.scatter(
-                buys["Date"], buys["EquityCurve"],
+                dates[buy_mask], equity[buy_mask],
                 marker="^", color="green", s=100, label="Buy"
             )
-        if not sells.empty:
+        if sell_mask.any():
             ax1.scatter(
-                sells["Date"], sells["EquityCurve"],
+                dates[sell_mask], equity[sell_mask],
                 marker="v", color="red", s=100, label="Sell"
             )
 
@@ -358,9 +526,7 @@ def plot_equity_curve(df, show_plot=False):
     ax1.legend(handles, labels)
 
     # -- Plot drawdown --
-    df["Peak"]     = df["EquityCurve"].cummax()
-    df["Drawdown"] = (df["EquityCurve"] - df["Peak"]) / df["Peak"]
-    ax2.fill_between(df["Date"], df["Drawdown"], 0, color="red", alpha=0.3)
+    ax2.fill_between(dates, arrays.drawdown, 0, color="red", alpha=0.3)
 
     ax2.set_title("Drawdown")
     ax2.set_xlabel("Date")
@@ -376,11 +542,61 @@ def plot_equity_curve(df, show_plot=False):
     return fig
 
 
+# -----------------------------------------------------
+# Strategy modules are loaded once and remembered here
+# -----------------------------------------------------
+_STRAT_CACHE = {}
+
+def load_strategy(strategy_name):
+    """Return the generate_signals function of strategies/<strategy_name>.py, importing it on first use."""
+    generate_signals = _STRAT_CACHE.get(strategy_name)
+    if generate_signals is None:
+        generate_signals = importlib.import_module(f"strategies.{strategy_name}").generate_signals
+        _STRAT_CACHE[strategy_name] = generate_signals
+    return generate_signals
+
+
+# -----------------------------------------------------
+# Strategy outputs are remembered per (strategy, price data), so re-running
+# the same backtest skips the indicator and signal work
+# -----------------------------------------------------
+_SIGNALS_CACHE = OrderedDict()
+_SIGNALS_CACHE_SIZE = 32
+
+def _price_data_key(df):
+    """Fingerprint of a price DataFrame - any changed date or price gives a new key."""
+    row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    return tuple(df.columns), len(df), hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest()
+
+
+def run_strategy(strategy_name, df):
+    """Return the generate_signals output of strategy_name for df, reusing an earlier identical run.
+
+    The caller always gets its own copy, so it can modify the result freely.
+    """
+    key = (strategy_name, _price_data_key(df))
+    strategy_df = _SIGNALS_CACHE.get(key)
+    if strategy_df is None:
+        strategy_df = load_strategy(strategy_name)(df)
+        if not isinstance(strategy_df, pd.DataFrame):
+            return strategy_df  # main reports the bad result; nothing worth caching
+        _SIGNALS_CACHE[key] = strategy_df
+        if len(_SIGNALS_CACHE) > _SIGNALS_CACHE_SIZE:
+            _SIGNALS_CACHE.popitem(last=False)
+    else:
+        _SIGNALS_CACHE.move_to_end(key)
+    return strategy_df.copy()
+
+
 # -----------------------------------------------------
 # This is the main function that runs everything
 # -----------------------------------------------------
-def main(ticker, strategy_name, start_date=None, end_date=None, show_plot=False):
-    """Main backtesting function."""
+def main(ticker, strategy_name, start_date=None, end_date=None, show_plot=False, data=None):
+    """Main backtesting function.
+
+    data can be a price DataFrame already returned by get_data, in which case
+    it is used as-is instead of downloading again.
+    """
     print(f"Getting {ticker} data...")
     
     # Convert datetime objects to pandas Timestamp if needed
@@ -392,9 +608,12 @@ def main(ticker, strategy_name, start_date=None, end_date=None, show_plot=False)
         if isinstance(end_date, date):
             end_date = pd.Timestamp(end_date)
     
-    # Get price data with date range directly
+    # Get price data with date range directly (unless the caller already has it)
     try:
-        df = get_data.get_data(ticker, start_date=start_date, end_date=end_date)
+        if data is None:
+            df = get_data.get_data(ticker, start_date=start_date, end_date=end_date)
+        else:
+            df = data
         print(f"Data retrieved from {df.index[0].strftime('%Y-%m-%d')} to {df.index[-1].strftime('%Y-%m-%d')}")
     except Exception as e:
         print(f"Error getting data: {str(e)}")
@@ -407,8 +626,8 @@ def main(ticker, strategy_name, start_date=None, end_date=None, show_plot=False)
     # Load and run strategy
     try:
         print(f"Applying strategy: {strategy_name}")
-        strategy_module = importlib.import_module(f"strategies.{strategy_name}")
-        strategy_df = strategy_module.generate_signals(df.copy())
+        # Prices we downloaded ourselves aren't used again, so only copy the caller's data
+        strategy_df = run_strategy(strategy_name, df if data is None else df.copy())
         
         # Verify the strategy returned a valid dataframe
         if strategy_df is None:
@@ -434,11 +653,24 @@ def main(ticker, strategy_name, start_date=None, end_date=None, show_plot=False)
         print(f"Error applying strategy: {str(e)}")
         return None, None, None
     
+    # Store the equity curve as float32 and signals as int8 - plenty of precision for
+    # returns/drawdown and half (or less) the memory to sweep in every scan below.
+    # Close stays float64 because it becomes the exported trade entry/exit prices.
+    strategy_df["EquityCurve"] = strategy_df["EquityCurve"].astype(np.float32)
+    strategy_df["Signal"] = strategy_df["Signal"].astype(np.int8)
+    
+    # Add a flag to the strategy_df to indicate if it's a short strategy
+    is_short_strategy = "short" in strategy_name.lower() if strategy_name else False
+    strategy_df.attrs['is_short_strategy'] = is_short_strategy
+    
+    # Metrics and chart only need four columns - take them out of the DataFrame once
+    arrays = BacktestArrays.from_df(strategy_df)
+    
     # Check for signals directly in the dataframe
-    has_signals = (strategy_df["Signal"] != 0).any()
+    has_signals = (arrays.signal != 0).any()
     
     # Calculate and display metrics
-    result = calculate_metrics(strategy_df, strategy_name)
+    result = calculate_metrics(arrays, strategy_name)
     
     # Even if calculate_metrics returns None but we have signals, we should still
     # return the strategy_df with an empty trades_df so the chart can be displayed
@@ -448,11 +680,12 @@ def main(ticker, strategy_name, start_date=None, end_date=None, show_plot=False)
             # Create empty metrics to allow visualization
             empty_metrics = {
                 "Total Trades": 0,
-                "Total Return": f"{strategy_df['EquityCurve'].iloc[-1] / strategy_df['EquityCurve'].iloc[0] - 1:.2%}",
+                "Total Return": f"{arrays.equity[-1] / arrays.equity[0] - 1:.2%}",
                 "Note": "Limited metrics available - see chart for signals"
             }
             # Plot results anyway
-            plot_equity_curve(strategy_df, show_plot=show_plot)
+            if show_plot:
+                plot_equity_curve(arrays, show_plot=True)
             # Return basic results to allow visualization
             return empty_metrics, pd.DataFrame(), strategy_df
         else:
@@ -461,12 +694,9 @@ def main(ticker, strategy_name, start_date=None, end_date=None, show_plot=False)
     
     metrics, trades_df = result
     
-    # Add a flag to the strategy_df to indicate if it's a short strategy
-    is_short_strategy = "short" in strategy_name.lower() if strategy_name else False
-    strategy_df.attrs['is_short_strategy'] = is_short_strategy
-    
-    # Plot results
-    plot_equity_curve(strategy_df, show_plot=show_plot)
+    # Plot results (callers like the GUI draw their own chart, so skip it unless it will be shown)
+    if show_plot:
+        plot_equity_curve(arrays, show_plot=True)
     
     return metrics, trades_df, strategy_df
 
@@ -478,54 +708,44 @@ def calculate_monthly_returns(strategy_df):
     2. Yearly strategy returns (StratReturns) - compounded return for the year
     3. Yearly buy-and-hold returns (bh_returns) - benchmark comparison
     """
-    df = strategy_df.copy()
-    df["Year"] = df["Date"].dt.year
-    df["Month"] = df["Date"].dt.month
-
     # Check if this is a short strategy
     is_short_strategy = strategy_df.attrs.get('is_short_strategy', False)
     
-    # Strategy monthly returns
-    df["Daily_Return"] = df["EquityCurve"].pct_change()
+    # Strategy daily returns
+    strat_daily = _daily_returns(strategy_df["EquityCurve"].to_numpy()).astype(np.float64)
     
-    # Buy and hold monthly returns - For short strategies, invert the buy and hold returns
+    # Buy and hold daily returns - For short strategies, invert the buy and hold returns
     if is_short_strategy:
-        df["BH_Daily"] = -df["Close"].pct_change()  # Invert returns for shorts
+        bh_daily = -_daily_returns(strategy_df["Close"].to_numpy()).astype(np.float64)  # Invert returns for shorts
         print("Calculating monthly returns for short strategy - inverting buy and hold returns")
     else:
-        df["BH_Daily"] = df["Close"].pct_change()
+        bh_daily = _daily_returns(strategy_df["Close"].to_numpy()).astype(np.float64)
+    
+    # Rows are in date order, so each calendar month is one contiguous run of bars and
+    # compounding is a single pass over the returns instead of a groupby
+    months = strategy_df["Date"].to_numpy().astype("datetime64[M]")
+    month_starts = _run_starts(months)
+    strat_monthly = _compound_runs(strat_daily, month_starts)
+    bh_monthly = _compound_runs(bh_daily, month_starts)
+    
+    month_keys = months[month_starts]
+    years = month_keys.astype("datetime64[Y]").astype(np.int64) + 1970
+    month_numbers = month_keys.astype(np.int64) % 12 + 1
     
     # Calculate regular monthly returns
-    monthly_returns = df.groupby(["Year", "Month"])["Daily_Return"].apply(lambda x: (x + 1).prod() - 1).unstack()
-    bh_returns = df.groupby(["Year", "Month"])["BH_Daily"].apply(lambda x: (x + 1).prod() - 1).unstack()
+    index = pd.MultiIndex.from_arrays([years, month_numbers], names=["Year", "Month"])
+    monthly_returns = pd.Series(strat_monthly, index=index).unstack()
+    bh_returns = pd.Series(bh_monthly, index=index).unstack()
 
     # Format month columns
-    monthly_returns.columns = [pd.to_datetime(str(m), format="%m").strftime("%b") for m in monthly_returns.columns]
-    bh_returns.columns = [pd.to_datetime(str(m), format="%m").strftime("%b") for m in bh_returns.columns]
-
-    # Calculate compounded yearly returns instead of summing
-    # Strategy returns compounded
-    strat_yearly_returns = {}
-    for year in monthly_returns.index.get_level_values(0).unique():
-        year_returns = monthly_returns.loc[year]
-        # Compound the monthly returns: (1+r1)*(1+r2)*...(1+r12) - 1
-        compounded_return = (year_returns + 1).prod(skipna=True) - 1
-        # Handle the case where all months are NaN
-        if pd.isna(compounded_return):
-            compounded_return = 0
-        strat_yearly_returns[year] = compounded_return
-    
-    # Buy and hold returns compounded
-    bh_yearly_returns = {}
-    for year in bh_returns.index.get_level_values(0).unique():
-        year_returns = bh_returns.loc[year]
-        # Compound the monthly returns: (1+r1)*(1+r2)*...(1+r12) - 1
-        compounded_return = (year_returns + 1).prod(skipna=True) - 1
-        # Handle the case where all months are NaN
-        if pd.isna(compounded_return):
-            compounded_return = 0
-        bh_yearly_returns[year] = compounded_return
-    
+    monthly_returns.columns = [_MONTH_ABBR[m - 1] for m in monthly_returns.columns]
+    bh_returns.columns = [_MONTH_ABBR[m - 1] for m in bh_returns.columns]
+
+    # Compounded yearly returns - compounding a year's months is the same as compounding its days
+    year_starts = _run_starts(years)
+    strat_yearly_returns = pd.Series(_compound_runs(strat_monthly, year_starts), index=years[year_starts])
+    bh_yearly_returns = pd.Series(_compound_runs(bh_monthly, year_starts), index=years[year_starts])
+
     # Add compounded yearly returns to the DataFrame
     monthly_returns["StratReturns"] = monthly_returns.index.get_level_values(0).map(strat_yearly_returns)
     bh_returns["bh_returns"] = bh_returns.index.get_level_values(0).map(bh_yearly_returns)
@@ -536,13 +756,59 @@ def calculate_monthly_returns(strategy_df):
     
     return final_df
 
+# -----------------------------------------------------
+# This runs many backtests in parallel (one process per CPU core)
+# -----------------------------------------------------
+def run_many(jobs, max_workers=None):
+    """Run a batch of (ticker, strategy_name, start_date, end_date) backtests in parallel.
+
+    Each ticker/date range is downloaded once up front and handed to the workers,
+    so running ten strategies on SPY doesn't hit yfinance ten times.
+    Returns a dict mapping each job tuple to main()'s (metrics, trades_df, strategy_df).
+    """
+    results = {}
+    prices = {}
+    for ticker, _, start_date, end_date in jobs:
+        key = (ticker, start_date, end_date)
+        if key not in prices:
+            try:
+                prices[key] = get_data.get_data(ticker, start_date=start_date, end_date=end_date)
+            except Exception as e:
+                print(f"Error getting data: {str(e)}")
+                prices[key] = None
+    
+    if max_workers is None:
+        max_workers = min(len(jobs), os.cpu_count() or 1)
+    
+    with ProcessPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        futures = {}
+        for job in jobs:
+            ticker, strategy_name, start_date, end_date = job
+            data = prices[(ticker, start_date, end_date)]
+            if data is None:
+                results[job] = (None, None, None)
+                continue
+            futures[executor.submit(main, ticker, strategy_name, start_date, end_date, False, data)] = job
+        
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                results[job] = future.result()
+            except Exception as e:
+                print(f"Error running backtest {job}: {str(e)}")
+                results[job] = (None, None, None)
+    
+    return results
+
 # -----------------------------------------------------
 # This lets us run the program from command line
 # -----------------------------------------------------
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run backtest on any ticker with any strategy.")
-    parser.add_argument("--ticker", type=str, required=True, help="Ticker symbol (e.g., SPY, AAPL, TSLA)")
-    parser.add_argument("--strategy", type=str, required=True, help="Strategy name without .py (e.g., strategy1)")
+    parser.add_argument("--ticker", type=str, required=True,
+                        help="Ticker symbol (e.g., SPY, AAPL, TSLA), or several separated by commas")
+    parser.add_argument("--strategy", type=str, required=True,
+                        help="Strategy name without .py (e.g., strategy1), or several separated by commas")
     parser.add_argument("--start_date", type=str, help="Start date in YYYY-MM-DD format")
     parser.add_argument("--end_date", type=str, help="End date in YYYY-MM-DD format")
     parser.add_argument("--no-plot", action="store_true", help="Run without displaying the plot window")
@@ -551,7 +817,23 @@ if __name__ == "__main__":
     start_date = pd.Timestamp(args.start_date) if args.start_date else None
     end_date = pd.Timestamp(args.end_date) if args.end_date else None
     
-    main(args.ticker, args.strategy, start_date, end_date, show_plot=not args.no_plot)
+    tickers = [t.strip() for t in args.ticker.split(",") if t.strip()]
+    strategies = [s.strip() for s in args.strategy.split(",") if s.strip()]
+    
+    if len(tickers) == 1 and len(strategies) == 1:
+        main(tickers[0], strategies[0], start_date, end_date, show_plot=not args.no_plot)
+    else:
+        # Several combinations - run them all in parallel and print a summary
+        jobs = [(t, s, start_date, end_date) for t in tickers for s in strategies]
+        results = run_many(jobs)
+        print("\nSummary:")
+        for ticker, strategy_name, _, _ in jobs:
+            metrics = results[(ticker, strategy_name, start_date, end_date)][0]
+            if metrics is None:
+                print(f"{ticker:<8} {strategy_name:<45} no trades")
+            else:
+                print(f"{ticker:<8} {strategy_name:<45} Return {metrics.get('Total Return', 'N/A'):>10}  "
+                      f"Sharpe {metrics.get('Sharpe Ratio', 'N/A'):>6}  Trades {metrics.get('Total Trades', 0)}")
 
 
    
\ No newline at end of file
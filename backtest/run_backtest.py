@@ -2,20 +2,17 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import ttk, messagebox
 import importlib
+import functools
 import os
 import sys
-import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the parent directory to sys.path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Import our own modules
-import backtest
-from backtest import calculate_monthly_returns
+# Import our own modules (backtest and matplotlib are loaded on first use, see below)
 from utils.strategy_descriptions import get_strategy_description, get_all_strategy_names
 
 # =============================================================================
@@ -35,12 +32,157 @@ COLORS = {
     "warning": "#f59e0b",
 }
 
+# The same colors parsed once for matplotlib, which would otherwise re-parse the hex
+# strings for every artist that uses them (same values as matplotlib.colors.to_rgba)
+COLORS_RGBA = {name: tuple(int(value[i:i + 2], 16) / 255 for i in (1, 3, 5)) + (1.0,)
+               for name, value in COLORS.items()}
+
+# Monthly-table columns shown as percentages
+PCT_COLUMNS = frozenset(["StratReturns", "bh_returns", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                         "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"])
+
+# The embedded chart is only ~1200px wide; longer series are thinned to this many points
+CHART_MAX_POINTS = 5000
+CHART_DOWNSAMPLE_POINTS = 3000
+
 # Configure CustomTkinter
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
-# Configure matplotlib for dark theme
-plt.style.use('dark_background')
+# matplotlib and backtest (pandas, yfinance) take longer to import than the rest of the
+# app together, so they are loaded when first needed instead of before the window appears
+Figure = PolyCollection = FigureCanvasTkAgg = NavigationToolbar2Tk = None
+AutoDateLocator = ConciseDateFormatter = date2num = None
+
+
+def _load_matplotlib():
+    """Import matplotlib and apply the dark theme, the first time a chart is built"""
+    global Figure, PolyCollection, FigureCanvasTkAgg, NavigationToolbar2Tk
+    global AutoDateLocator, ConciseDateFormatter, date2num
+    if Figure is not None:
+        return
+    import matplotlib
+    # Every figure here is drawn by Agg into a Tk canvas; pin that backend before pyplot
+    # is imported so it never probes for (or falls back to) another one
+    matplotlib.use("TkAgg")
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+    from matplotlib.collections import PolyCollection
+    from matplotlib.dates import AutoDateLocator, ConciseDateFormatter, date2num
+    
+    # Configure matplotlib for dark theme
+    plt.style.use('dark_background')
+    # Theme text, ticks and grid here so each axis needs only its titles and labels set
+    plt.rcParams.update({
+        "axes.titlecolor": COLORS_RGBA["text"],
+        "axes.labelcolor": COLORS_RGBA["text"],
+        "xtick.color": COLORS_RGBA["text_secondary"],
+        "ytick.color": COLORS_RGBA["text_secondary"],
+        "axes.grid": True,
+        "grid.color": COLORS["border"],  # hex, not RGBA: an explicit alpha channel overrides grid.alpha
+        "grid.alpha": 0.3,
+    })
+    # Figure is assigned last: it is what marks the module as loaded
+    from matplotlib.figure import Figure
+
+
+def _backtest():
+    """The backtest module, imported on first use"""
+    return importlib.import_module("backtest")
+
+STRATEGIES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "strategies")
+
+
+def _list_strategies():
+    """Names of the strategy modules in strategies/, rescanned only when the folder changes"""
+    # Adding, removing or renaming a file bumps the directory's mtime, so one stat() decides
+    # whether the cached listing still holds
+    return _scan_strategies(os.stat(STRATEGIES_DIR).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=1)
+def _scan_strategies(dir_mtime_ns):
+    with os.scandir(STRATEGIES_DIR) as entries:
+        return tuple(sorted(entry.name[:-3] for entry in entries
+                            if entry.is_file() and entry.name.endswith(".py") and entry.name != "__init__.py"))
+
+
+@functools.lru_cache(maxsize=None)
+def _strategy_text(strategy_name):
+    """Description panel text for a strategy as Tk text/tag segments (the descriptions are static)"""
+    strategy_info = get_strategy_description(strategy_name)
+    return (f"{strategy_info['name']}\n\n", ("name",), strategy_info['description'])
+
+
+def _date_positions(dates, when):
+    """Positions in the sorted `dates` array of each timestamp in `when` that appears there"""
+    idx = np.searchsorted(dates, when)
+    found = idx < len(dates)
+    found[found] = dates[idx[found]] == when[found]
+    return idx[found]
+
+
+def _lttb(x, y, n_out):
+    """Indices of the `n_out` points of the line (x, y) kept by Largest-Triangle-Three-Buckets"""
+    n = len(x)
+    if n <= n_out:
+        return np.arange(n)
+    # First and last points are always kept; the ones between are split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    counts = np.diff(edges)
+    # Each bucket's mean point is the third vertex when choosing from the bucket before it
+    next_x = np.append(np.add.reduceat(x[:n - 1], edges[:-1])[1:] / counts[1:], x[-1])
+    next_y = np.append(np.add.reduceat(y[:n - 1], edges[:-1])[1:] / counts[1:], y[-1])
+    
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs((x[a] - next_x[i]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (next_y[i] - y[a]))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+def _drawdown_fill(ax):
+    """Empty drawdown polygon on `ax`, filled in per run by _set_drawdown"""
+    fill = PolyCollection([], color=COLORS_RGBA["danger"], alpha=0.4)
+    ax.add_collection(fill, autolim=False)
+    return fill
+
+
+def _drawdown_verts(x, drawdown):
+    """Outline of the drawdown fill.
+    
+    The dates are sorted and the fill always runs down from 0, so the outline is just the
+    series followed by the x axis back to the start - no need for fill_between's general
+    polygon building.
+    """
+    n = len(x)
+    verts = np.empty((2 * n, 2))
+    verts[:n, 0] = x
+    verts[:n, 1] = drawdown
+    verts[n:, 0] = x[::-1]
+    verts[n:, 1] = 0.0
+    return verts
+
+
+def _set_drawdown(ax, fill, x, drawdown):
+    """Point the drawdown polygon at a new series and rescale `ax` to it"""
+    verts = _drawdown_verts(x, drawdown)
+    fill.set_verts([verts])
+    # The polygon alone sets the limits (relim skips collections on older matplotlib)
+    ax.ignore_existing_data_limits = True
+    ax.update_datalim(verts)
+    ax.autoscale_view()
+
+
+def _use_date_ticks(ax):
+    """Date ticks/labels for an axis whose x values are matplotlib date numbers (set once per axis)"""
+    locator = AutoDateLocator()
+    ax.xaxis.set_major_locator(locator)
+    ax.xaxis.set_major_formatter(ConciseDateFormatter(locator))
 
 
 class DateEntry(ctk.CTkFrame):
@@ -79,14 +221,13 @@ class DateEntry(ctk.CTkFrame):
         self.day_entry.grid(row=0, column=4, padx=(3, 0))
     
     def get_date(self):
-        """Return a date object from the entered values"""
-        try:
-            year = int(self.year_var.get())
-            month = int(self.month_var.get())
-            day = int(self.day_var.get())
-            return datetime(year, month, day).date()
-        except ValueError:
-            return datetime.now().date()
+        """Return a date object from the entered values (raises ValueError if they aren't a valid date)"""
+        year = self.year_var.get().strip()
+        month = self.month_var.get().strip()
+        day = self.day_var.get().strip()
+        if not (year.isdigit() and month.isdigit() and day.isdigit()):
+            raise ValueError(f"'{year}/{month}/{day}' is not a date in YYYY/MM/DD form")
+        return date(int(year), int(month), int(day))
 
 
 class MonthlyReturnsTable(ctk.CTkFrame):
@@ -118,6 +259,10 @@ class MonthlyReturnsTable(ctk.CTkFrame):
         self.tree = ttk.Treeview(self, style="Dark.Treeview")
         self.tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
+        # Row colors (the tags outlive every refill of the table)
+        self.tree.tag_configure('odd', background=COLORS["bg_input"])
+        self.tree.tag_configure('even', background=COLORS["bg_card"])
+        
         # Scrollbars
         vsb = ctk.CTkScrollbar(self, command=self.tree.yview)
         hsb = ctk.CTkScrollbar(self, orientation="horizontal", command=self.tree.xview)
@@ -127,18 +272,12 @@ class MonthlyReturnsTable(ctk.CTkFrame):
 
     def update_table(self, df):
         """Update the table with new data"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
         self.tree["columns"] = ()
         
         if df is None or df.empty:
             return
         
-        # Remove MTM columns
-        mtm_columns = [col for col in df.columns if col.startswith('MTM_')]
-        if mtm_columns:
-            df = df.drop(columns=mtm_columns)
-        
         columns = list(df.columns)
         self.tree["columns"] = columns
         
@@ -148,28 +287,17 @@ class MonthlyReturnsTable(ctk.CTkFrame):
             self.tree.column(col, width=width, anchor="center")
             self.tree.heading(col, text=col)
         
-        # Configure row colors
-        self.tree.tag_configure('odd', background=COLORS["bg_input"])
-        self.tree.tag_configure('even', background=COLORS["bg_card"])
-        
-        for i, row in df.iterrows():
-            values = []
-            for col in columns:
-                if col in ["StratReturns", "bh_returns", "Jan", "Feb", "Mar", "Apr", 
-                          "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]:
-                    try:
-                        value = row[col]
-                        if pd.notnull(value):
-                            value = f"{value:.2%}"
-                        else:
-                            value = ""
-                    except:
-                        value = str(row[col])
-                else:
-                    value = str(row[col])
-                values.append(value)
-            tag = 'odd' if i % 2 else 'even'
-            self.tree.insert("", "end", values=values, tags=(tag,))
+        # Format every cell up front (one pass per column), then insert the rows
+        fmt = df.astype(str)
+        for col in columns:
+            if col in PCT_COLUMNS:
+                values = df[col]
+                fmt[col] = values.map("{:.2%}".format, na_action="ignore").where(values.notnull(), "")
+
+        # Straight to Tcl: Treeview.insert would re-normalise the same two options for every row
+        call, tree = self.tree.tk.call, self.tree._w
+        for i, values in enumerate(fmt.to_numpy().tolist()):
+            call(tree, "insert", "", "end", "-values", values, "-tags", 'odd' if i & 1 else 'even')
 
 
 class BacktestApp:
@@ -180,8 +308,18 @@ class BacktestApp:
         self.root.minsize(1000, 700)
         self.root.configure(fg_color=COLORS["bg_dark"])
         
+        # The embedded chart is built by the first display_results (see _create_chart)
+        self._fig = None
         self.canvas_widget = None
         self.current_figure = None
+        # "Open Interactive Graph" window; its figure is reused until the user closes it
+        self._graph_window = None
+        self._monthly_cache = (None, None)
+        self._is_short = False
+        # Backtests run off the Tk thread; results come back through root.after
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        # Start importing backtest now, on the worker, so the first Run doesn't wait for it
+        self._pool.submit(_backtest)
         
         self._create_ui()
     
@@ -259,7 +397,7 @@ class BacktestApp:
                                           button_color=COLORS["accent"],
                                           button_hover_color=COLORS["accent_hover"],
                                           dropdown_fg_color=COLORS["bg_card"],
-                                          command=self.update_strategy_description)
+                                          command=self._on_strategy_selected)
         strategy_combo.pack(side="left", padx=(8, 0))
         
         # Input row 2 - Dates and Run button on same row
@@ -278,7 +416,7 @@ class BacktestApp:
         self.end_date.pack(side="left", padx=(8, 25))
         
         # Run button on same row
-        run_button = ctk.CTkButton(
+        self.run_button = ctk.CTkButton(
             input_row2, 
             text="Run Backtest",
             font=ctk.CTkFont(family="Segoe UI", size=12, weight="bold"),
@@ -289,7 +427,7 @@ class BacktestApp:
             corner_radius=6,
             command=self.run_backtest
         )
-        run_button.pack(side="left")
+        self.run_button.pack(side="left")
         
         # =================================================================
         # Results Tabview
@@ -310,6 +448,7 @@ class BacktestApp:
         # Results tab content - scrollable frame for metrics, expandable plot
         self.metrics_frame = ctk.CTkFrame(self.results_tab, fg_color="transparent")
         self.metrics_frame.pack(fill="x", padx=10, pady=(5, 5))
+        self._create_metrics_panel()
         
         self.plot_frame = ctk.CTkFrame(self.results_tab, fg_color=COLORS["bg_dark"], corner_radius=10)
         self.plot_frame.pack(fill="both", expand=True, padx=10, pady=(0, 5))
@@ -323,6 +462,8 @@ class BacktestApp:
                                          text_color=COLORS["text"], corner_radius=10,
                                          font=ctk.CTkFont(family="Segoe UI", size=12))
         self.desc_text.pack(fill="both", expand=True, padx=10, pady=10)
+        # The strategy name is set apart by a tag (CTkTextbox tags can't change the font)
+        self.desc_text.tag_config("name", foreground=COLORS["accent"])
         
         # =================================================================
         # Status Bar - Compact
@@ -339,25 +480,143 @@ class BacktestApp:
         status_label.pack(side="left", padx=15, pady=3)
         
         # Initialize strategy description
-        self.update_strategy_description()
+        self._on_strategy_selected()
 
-    def get_available_strategies(self):
-        strategies_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "strategies")
-        strategies = []
-        for file in os.listdir(strategies_dir):
-            if file.endswith(".py") and file != "__init__.py":
-                strategies.append(os.path.splitext(file)[0])
-        return sorted(strategies)
+    def _create_metrics_panel(self):
+        """Build the metrics header, card grid and action buttons once; display_results only updates them"""
+        self._metrics_header = ctk.CTkLabel(
+            self.metrics_frame, text="",
+            font=ctk.CTkFont(family="Segoe UI", size=13, weight="bold"),
+            text_color=COLORS["text"]
+        )
+        self._metrics_grid = ctk.CTkFrame(self.metrics_frame, fg_color="transparent")
+        self._metric_cells = []
+        
+        # Action buttons - compact
+        self._button_frame = ctk.CTkFrame(self.metrics_frame, fg_color="transparent")
+        
+        self._export_btn = ctk.CTkButton(
+            self._button_frame, text="Export Trades",
+            fg_color=COLORS["bg_input"], hover_color=COLORS["border"],
+            text_color=COLORS["text"], height=28, width=110,
+            font=ctk.CTkFont(size=11),
+            command=lambda: self.export_trades_to_csv(self.current_trades_df, self.current_ticker,
+                                                      self.current_strategy)
+        )
+        self._export_btn.pack(side="left", padx=(0, 8))
+        
+        self._export_monthly_btn = ctk.CTkButton(
+            self._button_frame, text="Export Monthly",
+            fg_color=COLORS["bg_input"], hover_color=COLORS["border"],
+            text_color=COLORS["text"], height=28, width=110,
+            font=ctk.CTkFont(size=11),
+            command=lambda: self.export_monthly_returns_to_csv(self.current_strategy_df, self.current_ticker,
+                                                               self.current_strategy)
+        )
+        self._export_monthly_btn.pack(side="left", padx=(0, 8))
+        
+        self._open_graph_btn = ctk.CTkButton(
+            self._button_frame, text="Open Interactive Graph",
+            fg_color=COLORS["accent"], hover_color=COLORS["accent_hover"],
+            text_color=COLORS["text"], height=28, width=150,
+            font=ctk.CTkFont(size=11),
+            command=self.open_interactive_graph
+        )
+        self._open_graph_btn.pack(side="left")
+
+    def _metric_cell(self, i):
+        """Return the i-th (card, name label, value label), creating it the first time it is needed"""
+        while len(self._metric_cells) <= i:
+            n = len(self._metric_cells)
+            card = ctk.CTkFrame(self._metrics_grid, fg_color=COLORS["bg_input"], corner_radius=6)
+            card.grid(row=n // 5, column=n % 5, padx=(0, 8), pady=1, sticky="w")
+            name_label = ctk.CTkLabel(card, text="", text_color=COLORS["text_secondary"],
+                                      font=ctk.CTkFont(size=10))
+            name_label.pack(side="left", padx=(8, 3), pady=5)
+            value_label = ctk.CTkLabel(card, text="", text_color=COLORS["text"],
+                                       font=ctk.CTkFont(size=10, weight="bold"))
+            value_label.pack(side="left", padx=(0, 8), pady=5)
+            self._metric_cells.append((card, name_label, value_label))
+        return self._metric_cells[i]
+
+    def _show_metrics_frame(self):
+        self.metrics_frame.pack(fill="x", padx=10, pady=(5, 5), before=self.plot_frame)
+
+    def _hide_metrics(self):
+        """Hide the metrics panel without destroying its widgets"""
+        for widget in (self._metrics_header, self._metrics_grid, self._button_frame):
+            widget.pack_forget()
+
+    def _create_chart(self):
+        """Build the embedded figure and canvas once; display_results only swaps their data"""
+        _load_matplotlib()
+        self._fig = Figure(figsize=(12, 8), facecolor=COLORS_RGBA["bg_dark"])
+        self._ax_eq = self._fig.add_subplot(2, 1, 1, facecolor=COLORS_RGBA["bg_card"])
+        self._ax_dd = self._fig.add_subplot(2, 1, 2, facecolor=COLORS_RGBA["bg_card"])
+        _use_date_ticks(self._ax_eq)
+        _use_date_ticks(self._ax_dd)
+        self._ax_eq.set(ylabel="Equity ($)")
+        self._ax_dd.set(title="Drawdown", xlabel="Date", ylabel="Drawdown")
+        
+        # Equity line and marker-only lines for entries/exits (markersize 10 == scatter s=100)
+        self._eq_line, = self._ax_eq.plot([], [], label="Equity Curve", linewidth=2, color=COLORS_RGBA["accent"])
+        self._entry_markers, = self._ax_eq.plot([], [], linestyle="none", markersize=10, zorder=5)
+        self._exit_markers, = self._ax_eq.plot([], [], linestyle="none", markersize=10, zorder=5)
+        self._dd_fill = _drawdown_fill(self._ax_dd)
+        # The data artists are animated: full redraws leave them out so they can be blitted
+        # over the saved axes, titles and ticks whenever those stay the same
+        self._data_artists = (self._dd_fill, self._eq_line, self._entry_markers, self._exit_markers)
+        for artist in self._data_artists:
+            artist.set_animated(True)
+        self._chart_bg = None
+        
+        self._canvas = FigureCanvasTkAgg(self._fig, master=self.plot_frame)
+        self._canvas.mpl_connect("draw_event", self._on_chart_draw)
+        self.canvas_widget = self._canvas.get_tk_widget()
+
+    def _on_chart_draw(self, event):
+        """After every full redraw, save the data-free chart and paint the data on top"""
+        self._chart_bg = self._canvas.copy_from_bbox(self._fig.bbox)
+        for artist in self._data_artists:
+            self._fig.draw_artist(artist)
+
+    def _blit_data(self):
+        """Redraw only the data artists over the saved chart background"""
+        self._canvas.restore_region(self._chart_bg)
+        for artist in self._data_artists:
+            self._fig.draw_artist(artist)
+        self._canvas.blit(self._fig.bbox)
+
+    def _hide_chart(self):
+        """Hide the embedded chart and remove any message shown in its place"""
+        if self.canvas_widget is not None:
+            self.canvas_widget.pack_forget()
+        for widget in self.plot_frame.winfo_children():
+            if widget is not self.canvas_widget:
+                widget.destroy()
 
-    def clear_frame(self, frame):
-        for widget in frame.winfo_children():
-            widget.destroy()
+    def get_available_strategies(self):
+        return list(_list_strategies())
+
+    def _monthly(self, strategy_df):
+        """Monthly returns for strategy_df, cached per backtest"""
+        # Keyed on the frame itself (not id()) so a recycled id can never hit a stale entry
+        cached_df, cached_monthly = self._monthly_cache
+        if cached_df is strategy_df:
+            return cached_monthly
+        monthly_df = _backtest().calculate_monthly_returns(strategy_df)
+        self._monthly_cache = (strategy_df, monthly_df)
+        return monthly_df
 
     def run_backtest(self):
         ticker = self.ticker_var.get().strip().upper()
         strategy = self.strategy_var.get()
-        start_date = self.start_date.get_date()
-        end_date = self.end_date.get_date()
+        try:
+            start_date = self.start_date.get_date()
+            end_date = self.end_date.get_date()
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid date: {e}")
+            return
 
         if not ticker:
             messagebox.showerror("Error", "Please enter a ticker symbol")
@@ -369,11 +628,26 @@ class BacktestApp:
             messagebox.showerror("Error", "Start date must be before end date")
             return
 
+        # Direction and marker styles are fixed by the strategy name; work them out once per run
+        is_short = 'short' in strategy.lower()
+        self._is_short = is_short
+        self._entry_style = ('v', COLORS_RGBA["danger"], 'Short') if is_short else ('^', COLORS_RGBA["success"], 'Buy')
+        self._exit_style = ('^', COLORS_RGBA["success"], 'Cover') if is_short else ('v', COLORS_RGBA["danger"], 'Sell')
+
         self.status_var.set(f"Running backtest for {ticker} with {strategy}...")
-        self.root.update()
+        self.run_button.configure(state="disabled")
+
+        future = self._pool.submit(
+            lambda: _backtest().main(ticker, strategy, start_date, end_date, show_plot=False))
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._finish_backtest, f, ticker, strategy))
+
+    def _finish_backtest(self, future, ticker, strategy):
+        """Show the result of a backtest submitted by run_backtest (runs on the Tk thread)"""
+        self.run_button.configure(state="normal")
 
         try:
-            result = backtest.main(ticker, strategy, start_date, end_date, show_plot=False)
+            result = future.result()
             
             if result is None or (isinstance(result, tuple) and len(result) < 3):
                 self.status_var.set(f"No data available for {ticker} with {strategy}")
@@ -402,294 +676,318 @@ class BacktestApp:
             print(traceback.format_exc())
             messagebox.showerror("Backtest Error", f"Error: {error_msg}")
             self.status_var.set(f"Error running backtest")
-            self.clear_frame(self.metrics_frame)
-            self.clear_frame(self.plot_frame)
+            self._hide_metrics()
+            self._hide_chart()
 
     def export_trades_to_csv(self, trades_df, ticker, strategy):
         if trades_df is None or trades_df.empty:
             messagebox.showinfo("Export", "No trades to export")
             return
         
-        is_short_strategy = 'short' in strategy.lower()
-        if 'Profit %' not in trades_df.columns:
-            if is_short_strategy:
-                trades_df['Profit %'] = (trades_df['Entry Price'] - trades_df['Exit Price']) / trades_df['Entry Price'] * 100
-            else:
-                trades_df['Profit %'] = (trades_df['Exit Price'] - trades_df['Entry Price']) / trades_df['Entry Price'] * 100
-        
-        export_columns = ['Entry Date', 'Exit Date', 'Entry Price', 'Exit Price', 'Profit %']
+        export_columns = ['Entry Date', 'Exit Date', 'Entry Price', 'Exit Price']
         if 'Type' in trades_df.columns:
             export_columns.insert(0, 'Type')
         
-        export_df = trades_df[export_columns]
-        filename = f"{ticker}_{strategy}_trades.csv"
-        save_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
-        export_df.to_csv(save_path, index=False)
-        messagebox.showinfo("Export", f"Trades exported to {save_path}")
+        # A new frame for the file, so the shared trades_df never gains columns
+        export_df = trades_df.loc[:, export_columns]
+        if 'Profit %' in trades_df.columns:
+            export_df['Profit %'] = trades_df['Profit %'].to_numpy()
+        else:
+            # Direction per trade from the Type column when present, else from the strategy name
+            if 'Type' in trades_df.columns:
+                sign = np.where(trades_df['Type'].str.lower().eq('short').to_numpy(), -1.0, 1.0)
+            else:
+                sign = -1.0 if self._is_short else 1.0
+            entry_price = trades_df['Entry Price'].to_numpy()
+            exit_price = trades_df['Exit Price'].to_numpy()
+            export_df['Profit %'] = sign * (exit_price - entry_price) / entry_price * 100.0
+        
+        self._write_csv(export_df, f"{ticker}_{strategy}_trades.csv", "Trades", lineterminator='\n')
 
     def export_monthly_returns_to_csv(self, strategy_df, ticker, strategy):
-        monthly_df = calculate_monthly_returns(strategy_df)
-        mtm_columns = [col for col in monthly_df.columns if col.startswith('MTM_')]
-        if mtm_columns:
-            monthly_df = monthly_df.drop(columns=mtm_columns)
-        
-        filename = f"{ticker}_{strategy}_monthly_returns.csv"
+        monthly_df = self._monthly(strategy_df)
+        self._write_csv(monthly_df, f"{ticker}_{strategy}_monthly_returns.csv", "Monthly returns")
+
+    def _write_csv(self, df, filename, what, **to_csv_kwargs):
+        """Write df next to this script on the worker thread and report the outcome on the Tk thread"""
         save_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
-        monthly_df.to_csv(save_path, index=False)
-        messagebox.showinfo("Export", f"Monthly returns exported to {save_path}")
+        future = self._pool.submit(df.to_csv, save_path, index=False, **to_csv_kwargs)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._finish_export, f, what, save_path))
+
+    def _finish_export(self, future, what, save_path):
+        try:
+            future.result()
+        except Exception as e:
+            messagebox.showerror("Export", f"Could not export {what.lower()}: {e}")
+            return
+        messagebox.showinfo("Export", f"{what} exported to {save_path}")
 
     def display_results(self, result, ticker, strategy):
         """Display backtest results with modern styling"""
-        self.clear_frame(self.metrics_frame)
-        self.clear_frame(self.plot_frame)
-        plt.close('all')
+        # The metrics panel is taken out of the layout while it is refilled, so Tk lays it out once
+        self.metrics_frame.pack_forget()
+        self._hide_metrics()
+        self._hide_chart()
         
         if result is None or not isinstance(result, tuple) or len(result) < 3:
-            ctk.CTkLabel(self.metrics_frame, text=f"No valid results for {ticker}",
-                        text_color=COLORS["danger"]).pack(pady=20)
+            self._metrics_header.configure(text=f"No valid results for {ticker}", text_color=COLORS["danger"])
+            self._metrics_header.pack(pady=20)
+            self._show_metrics_frame()
             return
         
         metrics, trades_df, strategy_df = result
         has_chart_data = strategy_df is not None and not strategy_df.empty
         has_metrics = metrics is not None
         has_trades = trades_df is not None and not trades_df.empty
-        is_short_strategy = 'short' in strategy.lower()
         
         self.current_ticker = ticker
         self.current_strategy = strategy
         self.current_strategy_df = strategy_df
         self.current_trades_df = trades_df
-        self.is_short_strategy = is_short_strategy
+        # Dates, their matplotlib date numbers, equity, drawdown and the trade entry/exit bars,
+        # shared with the interactive graph; plotting the numbers spares matplotlib converting
+        # every timestamp on each plot call, and the drawdown and trade positions are worked out
+        # once per run rather than once per chart
+        if has_chart_data:
+            if self._fig is None:
+                self._create_chart()
+            dates = strategy_df["Date"].to_numpy()
+            equity = strategy_df["EquityCurve"].to_numpy()
+            drawdown = _backtest()._drawdown(equity)[0]
+            entry_idx = exit_idx = np.empty(0, dtype=np.intp)
+            if has_trades:
+                if trades_df.ndim == 1:  # a single trade as a Series
+                    trades_df = trades_df.to_frame().T
+                entry_idx = _date_positions(dates, trades_df['Entry Date'].to_numpy())
+                exit_idx = _date_positions(dates, trades_df['Exit Date'].to_numpy())
+            self._chart_arrays = (dates, date2num(dates), equity, drawdown, entry_idx, exit_idx)
+        else:
+            self._chart_arrays = None
 
         # Update monthly returns table
         try:
-            monthly_df = calculate_monthly_returns(strategy_df)
-            mtm_columns = [col for col in monthly_df.columns if col.startswith('MTM_')]
-            if mtm_columns:
-                monthly_df = monthly_df.drop(columns=mtm_columns)
+            monthly_df = self._monthly(strategy_df)
             self.monthly_table.update_table(monthly_df)
         except Exception as e:
             print(f"Warning: Could not calculate monthly returns: {e}")
             self.monthly_table.update_table(None)
 
         # Metrics display - compact layout
-        metrics_header = ctk.CTkLabel(
-            self.metrics_frame,
-            text=f"{ticker} - {strategy} Performance" + (" (SHORT)" if is_short_strategy else ""),
-            font=ctk.CTkFont(family="Segoe UI", size=13, weight="bold"),
+        self._metrics_header.configure(
+            text=f"{ticker} - {strategy} Performance" + (" (SHORT)" if self._is_short else ""),
             text_color=COLORS["text"]
         )
-        metrics_header.pack(anchor="w", pady=(0, 5))
+        self._metrics_header.pack(anchor="w", pady=(0, 5))
 
         if has_metrics:
-            metrics_grid = ctk.CTkFrame(self.metrics_frame, fg_color="transparent")
-            metrics_grid.pack(fill="x")
-            
-            col = 0
-            row_frame = None
             for i, (metric, value) in enumerate(metrics.items()):
-                if col == 0:
-                    row_frame = ctk.CTkFrame(metrics_grid, fg_color="transparent")
-                    row_frame.pack(fill="x", pady=1)
-                
-                metric_card = ctk.CTkFrame(row_frame, fg_color=COLORS["bg_input"], corner_radius=6)
-                metric_card.pack(side="left", padx=(0, 8), pady=1)
-                
-                ctk.CTkLabel(metric_card, text=f"{metric}:", 
-                            text_color=COLORS["text_secondary"],
-                            font=ctk.CTkFont(size=10)).pack(side="left", padx=(8, 3), pady=5)
-                ctk.CTkLabel(metric_card, text=str(value),
-                            text_color=COLORS["text"],
-                            font=ctk.CTkFont(size=10, weight="bold")).pack(side="left", padx=(0, 8), pady=5)
-                
-                col += 1
-                if col >= 5:
-                    col = 0
-
-        # Action buttons - compact
-        button_frame = ctk.CTkFrame(self.metrics_frame, fg_color="transparent")
-        button_frame.pack(fill="x", pady=(8, 5))
-        
-        export_btn = ctk.CTkButton(
-            button_frame, text="Export Trades",
-            fg_color=COLORS["bg_input"], hover_color=COLORS["border"],
-            text_color=COLORS["text"], height=28, width=110,
-            font=ctk.CTkFont(size=11),
-            command=lambda: self.export_trades_to_csv(trades_df, ticker, strategy),
-            state="normal" if has_trades else "disabled"
-        )
-        export_btn.pack(side="left", padx=(0, 8))
-        
-        export_monthly_btn = ctk.CTkButton(
-            button_frame, text="Export Monthly",
-            fg_color=COLORS["bg_input"], hover_color=COLORS["border"],
-            text_color=COLORS["text"], height=28, width=110,
-            font=ctk.CTkFont(size=11),
-            command=lambda: self.export_monthly_returns_to_csv(strategy_df, ticker, strategy),
-            state="normal" if has_chart_data else "disabled"
-        )
-        export_monthly_btn.pack(side="left", padx=(0, 8))
-        
-        open_graph_btn = ctk.CTkButton(
-            button_frame, text="Open Interactive Graph",
-            fg_color=COLORS["accent"], hover_color=COLORS["accent_hover"],
-            text_color=COLORS["text"], height=28, width=150,
-            font=ctk.CTkFont(size=11),
-            command=self.open_interactive_graph,
-            state="normal" if has_chart_data else "disabled"
-        )
-        open_graph_btn.pack(side="left")
-
-        # Create chart with dark theme - larger figure
+                card, name_label, value_label = self._metric_cell(i)
+                name_label.configure(text=f"{metric}:")
+                value_label.configure(text=str(value))
+                card.grid()
+            for card, _, _ in self._metric_cells[len(metrics):]:
+                card.grid_remove()
+            self._metrics_grid.pack(fill="x")
+
+        self._export_btn.configure(state="normal" if has_trades else "disabled")
+        self._export_monthly_btn.configure(state="normal" if has_chart_data else "disabled")
+        self._open_graph_btn.configure(state="normal" if has_chart_data else "disabled")
+        self._button_frame.pack(fill="x", pady=(8, 5))
+        self._show_metrics_frame()
+
+        # Update the embedded chart in place
         if has_chart_data:
             try:
-                fig = plt.figure(figsize=(12, 8), facecolor=COLORS["bg_dark"])
-                self.current_figure = fig
-                
-                ax1 = fig.add_subplot(2, 1, 1, facecolor=COLORS["bg_card"])
-                ax1.plot(strategy_df["Date"], strategy_df["EquityCurve"], 
-                        label="Equity Curve", linewidth=2, color=COLORS["accent"])
+                ax1, ax2 = self._ax_eq, self._ax_dd
+                _, x, equity, drawdown, entry_idx, exit_idx = self._chart_arrays
+                # Thin long series for the line and drawdown; markers still come from the full arrays
+                if len(x) > CHART_MAX_POINTS:
+                    keep = _lttb(x, equity, CHART_DOWNSAMPLE_POINTS)
+                    line_x, line_eq, line_dd = x[keep], equity[keep], drawdown[keep]
+                else:
+                    line_x, line_eq, line_dd = x, equity, drawdown
 
                 # Plot signals
-                if has_trades:
-                    if isinstance(trades_df, pd.Series):
-                        trades_df = pd.DataFrame([trades_df])
-                    
-                    entry_points = []
-                    exit_points = []
-                    
-                    for date in trades_df['Entry Date'].values:
-                        mask = strategy_df['Date'] == date
-                        if any(mask):
-                            idx = mask.idxmax()
-                            entry_points.append((date, strategy_df.loc[idx, 'EquityCurve']))
-                    
-                    for date in trades_df['Exit Date'].values:
-                        mask = strategy_df['Date'] == date
-                        if any(mask):
-                            idx = mask.idxmax()
-                            exit_points.append((date, strategy_df.loc[idx, 'EquityCurve']))
-                    
-                    if entry_points:
-                        entries_df = pd.DataFrame(entry_points, columns=['Date', 'EquityCurve'])
-                        marker = 'v' if is_short_strategy else '^'
-                        color = COLORS["danger"] if is_short_strategy else COLORS["success"]
-                        label = 'Short' if is_short_strategy else 'Buy'
-                        ax1.scatter(entries_df['Date'], entries_df['EquityCurve'], 
-                                   marker=marker, color=color, s=100, label=label, zorder=5)
-                    
-                    if exit_points:
-                        exits_df = pd.DataFrame(exit_points, columns=['Date', 'EquityCurve'])
-                        marker = '^' if is_short_strategy else 'v'
-                        color = COLORS["success"] if is_short_strategy else COLORS["danger"]
-                        label = 'Cover' if is_short_strategy else 'Sell'
-                        ax1.scatter(exits_df['Date'], exits_df['EquityCurve'],
-                                   marker=marker, color=color, s=100, label=label, zorder=5)
-
-                ax1.set_title(f"{ticker} - {strategy} Equity Curve", color=COLORS["text"], fontsize=12)
-                ax1.set_ylabel("Equity ($)", color=COLORS["text"])
-                ax1.tick_params(colors=COLORS["text_secondary"])
-                ax1.grid(True, alpha=0.3, color=COLORS["border"])
-                ax1.legend(facecolor=COLORS["bg_card"], edgecolor=COLORS["border"], 
-                          labelcolor=COLORS["text"])
+                entry_marker, entry_color, entry_label = self._entry_style
+                entry_label = entry_label if entry_idx.size else '_' + entry_label
+                exit_marker, exit_color, exit_label = self._exit_style
+                exit_label = exit_label if exit_idx.size else '_' + exit_label
+                title = f"{ticker} - {strategy} Equity Curve"
                 
-                # Drawdown chart
-                ax2 = fig.add_subplot(2, 1, 2, facecolor=COLORS["bg_card"])
-                strategy_df["Peak"] = strategy_df["EquityCurve"].cummax()
-                strategy_df["Drawdown"] = (strategy_df["EquityCurve"] - strategy_df["Peak"]) / strategy_df["Peak"]
-                ax2.fill_between(strategy_df["Date"], strategy_df["Drawdown"], 0, 
-                                color=COLORS["danger"], alpha=0.4)
-                ax2.set_title("Drawdown", color=COLORS["text"], fontsize=12)
-                ax2.set_xlabel("Date", color=COLORS["text"])
-                ax2.set_ylabel("Drawdown", color=COLORS["text"])
-                ax2.tick_params(colors=COLORS["text_secondary"])
-                ax2.grid(True, alpha=0.3, color=COLORS["border"])
+                # Title and legend are what's on screen, so only the data and limits can differ
+                static_unchanged = (self._chart_bg is not None
+                                    and ax1.get_title() == title
+                                    and self._entry_markers.get_label() == entry_label
+                                    and self._exit_markers.get_label() == exit_label)
+                limits = (ax1.get_xlim(), ax1.get_ylim(), ax2.get_xlim(), ax2.get_ylim())
                 
-                plt.tight_layout()
+                self._entry_markers.set_data(x[entry_idx], equity[entry_idx])
+                self._entry_markers.set(marker=entry_marker, color=entry_color, label=entry_label)
+                self._exit_markers.set_data(x[exit_idx], equity[exit_idx])
+                self._exit_markers.set(marker=exit_marker, color=exit_color, label=exit_label)
                 
-                canvas = FigureCanvasTkAgg(fig, master=self.plot_frame)
-                self.canvas_widget = canvas.get_tk_widget()
-                canvas.draw()
-                self.canvas_widget.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+                self.current_figure = self._fig
+                
+                if not (np.array_equal(self._eq_line.get_xdata(), line_x)
+                        and np.array_equal(self._eq_line.get_ydata(), line_eq)):
+                    self._eq_line.set_data(line_x, line_eq)
+                    ax1.relim()
+                    ax1.autoscale_view()
+                    _set_drawdown(ax2, self._dd_fill, line_x, line_dd)
                 
+                # Same limits too means the saved background (ticks, grid, labels) still holds
+                blit = static_unchanged and limits == (ax1.get_xlim(), ax1.get_ylim(),
+                                                       ax2.get_xlim(), ax2.get_ylim())
+                if not blit:
+                    ax1.set(title=title)
+                    ax1.legend(facecolor=COLORS_RGBA["bg_card"], edgecolor=COLORS_RGBA["border"], 
+                              labelcolor=COLORS_RGBA["text"])
+                    self._fig.tight_layout()
+                
+                # Pack and switch tabs before rendering so the chart is painted once, in place
+                self.canvas_widget.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
                 self.tabview.set("Results")
+                if blit:
+                    self._blit_data()
+                else:
+                    self._canvas.draw_idle()
                 
             except Exception as e:
                 print(f"Error creating chart: {e}")
+                self.canvas_widget.pack_forget()
                 ctk.CTkLabel(self.plot_frame, text=f"Error creating chart: {e}",
                             text_color=COLORS["danger"]).pack(pady=20)
 
     def open_interactive_graph(self):
-        """Open a separate matplotlib figure window"""
+        """Show the results in a separate window with the matplotlib pan/zoom toolbar"""
         if not hasattr(self, 'current_strategy_df') or self.current_strategy_df is None:
             messagebox.showinfo("Open Graph", "No backtest results available")
             return
         
-        is_short = hasattr(self, 'is_short_strategy') and self.is_short_strategy
-        
-        fig = plt.figure(figsize=(14, 9), facecolor=COLORS["bg_dark"])
-        
-        ax1 = fig.add_subplot(2, 1, 1, facecolor=COLORS["bg_card"])
-        ax1.plot(self.current_strategy_df["Date"], self.current_strategy_df["EquityCurve"],
-                linewidth=2, color=COLORS["accent"], label="Equity Curve")
-        
-        if self.current_trades_df is not None and not self.current_trades_df.empty:
-            trades_df = self.current_trades_df
-            if isinstance(trades_df, pd.Series):
-                trades_df = pd.DataFrame([trades_df])
-            
-            for date in trades_df['Entry Date'].values:
-                mask = self.current_strategy_df['Date'] == date
-                if any(mask):
-                    idx = mask.idxmax()
-                    marker = 'v' if is_short else '^'
-                    color = COLORS["danger"] if is_short else COLORS["success"]
-                    ax1.scatter(date, self.current_strategy_df.loc[idx, 'EquityCurve'],
-                               marker=marker, color=color, s=120, zorder=5)
-            
-            for date in trades_df['Exit Date'].values:
-                mask = self.current_strategy_df['Date'] == date
-                if any(mask):
-                    idx = mask.idxmax()
-                    marker = '^' if is_short else 'v'
-                    color = COLORS["success"] if is_short else COLORS["danger"]
-                    ax1.scatter(date, self.current_strategy_df.loc[idx, 'EquityCurve'],
-                               marker=marker, color=color, s=120, zorder=5)
-        
-        ax1.set_title(f"{self.current_ticker} - {self.current_strategy} Equity Curve",
-                     color=COLORS["text"], fontsize=14)
-        ax1.set_ylabel("Equity ($)", color=COLORS["text"])
-        ax1.tick_params(colors=COLORS["text_secondary"])
-        ax1.grid(True, alpha=0.3, color=COLORS["border"])
-        
-        ax2 = fig.add_subplot(2, 1, 2, facecolor=COLORS["bg_card"])
-        self.current_strategy_df["Peak"] = self.current_strategy_df["EquityCurve"].cummax()
-        self.current_strategy_df["Drawdown"] = (
-            self.current_strategy_df["EquityCurve"] - self.current_strategy_df["Peak"]
-        ) / self.current_strategy_df["Peak"]
-        ax2.fill_between(self.current_strategy_df["Date"], 
-                        self.current_strategy_df["Drawdown"], 0,
-                        color=COLORS["danger"], alpha=0.4)
-        ax2.set_title("Drawdown", color=COLORS["text"], fontsize=14)
-        ax2.set_xlabel("Date", color=COLORS["text"])
-        ax2.set_ylabel("Drawdown", color=COLORS["text"])
-        ax2.tick_params(colors=COLORS["text_secondary"])
-        ax2.grid(True, alpha=0.3, color=COLORS["border"])
-        
-        plt.tight_layout()
-        plt.show()
+        # The window is a CTk Toplevel with an embedded canvas, so it runs on the app's own
+        # event loop instead of a second one started by plt.show()
+        if self._graph_window is None or not self._graph_window.winfo_exists():
+            self._create_graph_window()
+        
+        ax1 = self._graph_fig.axes[0]
+        self._graph_window.title(f"{self.current_ticker} - {self.current_strategy}")
+        
+        # The window keeps its own reference, as later runs replace _chart_arrays
+        self._graph_arrays = self._chart_arrays
+        _, x, equity, _, entry_idx, exit_idx = self._graph_arrays
+        
+        # Full series first so the limits cover all of it; _thin_graph then cuts it to the view
+        self._graph_line.set_data(x, equity)
+        
+        marker, color, _ = self._entry_style
+        self._graph_entry.set_data(x[entry_idx], equity[entry_idx])
+        self._graph_entry.set(marker=marker, color=color)
+        marker, color, _ = self._exit_style
+        self._graph_exit.set_data(x[exit_idx], equity[exit_idx])
+        self._graph_exit.set(marker=marker, color=color)
+        
+        ax1.set_title(f"{self.current_ticker} - {self.current_strategy} Equity Curve", fontsize=14)
+        ax1.relim()
+        ax1.autoscale_view()
+        self._thin_graph(ax1)
+        
+        # Paint the equity curve straight away (with the previous run's drawdown blanked) and
+        # leave the drawdown to the next tick of the event loop, so the window never sits frozen
+        self._graph_dd_fill.set_verts([])
+        self._graph_fig.tight_layout()
+        self._graph_canvas.draw()
+        self._graph_window.lift()
+        self._graph_window.update_idletasks()
+        self.root.after(0, self._draw_graph_drawdown)
+
+    def _draw_graph_drawdown(self):
+        """Second pass of open_interactive_graph: fill in the drawdown axes"""
+        if self._graph_window is None or not self._graph_window.winfo_exists():
+            return
+        _, x, _, drawdown, _, _ = self._graph_arrays
+        ax2 = self._graph_fig.axes[1]
+        _set_drawdown(ax2, self._graph_dd_fill, x, drawdown)
+        self._thin_graph(ax2)
+        # Home on the toolbar goes back to this run's full view, not the previous run's
+        self._graph_toolbar.update()
+        self._graph_canvas.draw_idle()
+
+    def _close_graph_window(self):
+        """Destroy the interactive graph window and let its figure and arrays be freed"""
+        self._graph_window.destroy()
+        self._graph_window = None
+        self._graph_fig = self._graph_canvas = self._graph_toolbar = None
+        self._graph_line = self._graph_entry = self._graph_exit = self._graph_dd_fill = None
+        self._graph_arrays = None
+
+    def _thin_graph(self, ax):
+        """Cut the interactive graph's line or drawdown to the visible dates, LTTB-thinned.
+        
+        Runs whenever an axis' x limits change (pan, zoom, Home), so long series stay quick
+        to drag around while zooming in still brings back every point.
+        """
+        _, x, equity, drawdown, _, _ = self._graph_arrays
+        if len(x) <= CHART_MAX_POINTS:
+            return
+        lo, hi = ax.get_xlim()
+        # One point past each edge so the line runs off the sides of the view
+        start = max(np.searchsorted(x, lo) - 1, 0)
+        stop = min(np.searchsorted(x, hi, side="right") + 1, len(x))
+        if ax is self._graph_fig.axes[0]:
+            keep = start + _lttb(x[start:stop], equity[start:stop], CHART_DOWNSAMPLE_POINTS)
+            self._graph_line.set_data(x[keep], equity[keep])
+        else:
+            keep = start + _lttb(x[start:stop], drawdown[start:stop], CHART_DOWNSAMPLE_POINTS)
+            self._graph_dd_fill.set_verts([_drawdown_verts(x[keep], drawdown[keep])])
+
+    def _create_graph_window(self):
+        """Build the interactive graph window and the artists reused for every run shown in it"""
+        self._graph_window = ctk.CTkToplevel(self.root)
+        self._graph_window.geometry("1400x900")
+        self._graph_window.protocol("WM_DELETE_WINDOW", self._close_graph_window)
+        self._graph_fig = Figure(figsize=(14, 9), facecolor=COLORS_RGBA["bg_dark"])
+        ax1 = self._graph_fig.add_subplot(2, 1, 1, facecolor=COLORS_RGBA["bg_card"])
+        ax2 = self._graph_fig.add_subplot(2, 1, 2, facecolor=COLORS_RGBA["bg_card"])
+        
+        self._graph_line, = ax1.plot([], [], linewidth=2, color=COLORS_RGBA["accent"], label="Equity Curve")
+        self._graph_entry, = ax1.plot([], [], linestyle="none", markersize=11, zorder=5)
+        self._graph_exit, = ax1.plot([], [], linestyle="none", markersize=11, zorder=5)
+        self._graph_dd_fill = _drawdown_fill(ax2)
+        ax1.callbacks.connect("xlim_changed", self._thin_graph)
+        ax2.callbacks.connect("xlim_changed", self._thin_graph)
+        
+        ax1.set(ylabel="Equity ($)")
+        _use_date_ticks(ax1)
+        
+        ax2.set_title("Drawdown", fontsize=14)
+        ax2.set(xlabel="Date", ylabel="Drawdown")
+        _use_date_ticks(ax2)
+        
+        self._graph_canvas = FigureCanvasTkAgg(self._graph_fig, master=self._graph_window)
+        self._graph_toolbar = NavigationToolbar2Tk(self._graph_canvas, self._graph_window, pack_toolbar=False)
+        self._graph_toolbar.pack(side=tk.BOTTOM, fill=tk.X)
+        self._graph_canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+
+    def _on_strategy_selected(self, choice=None):
+        self.update_strategy_description()
+        # Import the chosen strategy on the worker thread now so Run doesn't wait for it;
+        # backtest caches the module, and any import error is reported by the run itself
+        strategy = self.strategy_var.get()
+        if strategy:
+            self._pool.submit(lambda: _backtest().load_strategy(strategy))
 
     def update_strategy_description(self, choice=None):
         """Update strategy description text"""
         selected_strategy = self.strategy_var.get()
         
         try:
-            strategy_info = get_strategy_description(selected_strategy)
-            self.desc_text.delete("1.0", "end")
-            self.desc_text.insert("1.0", f"{strategy_info['name']}\n\n{strategy_info['description']}")
+            segments = _strategy_text(selected_strategy)
         except Exception as e:
-            self.desc_text.delete("1.0", "end")
-            self.desc_text.insert("1.0", f"Error loading strategy description: {e}")
+            segments = (f"Error loading strategy description: {e}",)
+        # One Tk "replace" instead of a delete then an insert; CTkTextbox doesn't forward
+        # replace, so it goes to the tk.Text inside it
+        self.desc_text._textbox.replace("1.0", "end", *segments)
 
 
 if __name__ == "__main__":
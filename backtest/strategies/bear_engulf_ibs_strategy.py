@@ -3,6 +3,30 @@
 import pandas as pd
 import numpy as np
 
+# numba is optional - without it the signal loop below runs as plain Python
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _signal_loop(buy, sell):
+    """Buy on the first buy bar while flat, sell on the first sell bar while long."""
+    signal = np.zeros(len(buy), dtype=np.int8)  # -1/0/1 fits in a byte
+    in_position = False
+    for i in range(len(buy)):
+        if not in_position and buy[i]:
+            signal[i] = 1
+            in_position = True
+        elif in_position and sell[i]:
+            signal[i] = -1
+            in_position = False
+        # else leave 0
+    return signal
+
+
+_signals = njit(cache=True)(_signal_loop) if njit is not None else _signal_loop
+
 def generate_signals(df, ibs_limit: float = 0.3) -> pd.DataFrame:
     """
     Bearish Engulfing + IBS mean-reversion:
@@ -34,18 +58,20 @@ def generate_signals(df, ibs_limit: float = 0.3) -> pd.DataFrame:
             empty_df["Close"] = df["Close"].reset_index(drop=True)
         return empty_df
 
+    # work on plain arrays: pandas would align indexes on every one of the ops below
+    o, h, l, c = (df[col].to_numpy() for col in ('Open', 'High', 'Low', 'Close'))
+
     # calculate IBS
-    df['range'] = df['High'] - df['Low']
-    df['IBS']   = (df['Close'] - df['Low']) / df['range'].replace(0, np.nan)
+    rng = h - l
+    ibs = (c - l) / np.where(rng == 0, np.nan, rng)
 
     # yesterday's OHLC
-    df['Open_prev']  = df['Open'].shift(1)
-    df['Close_prev'] = df['Close'].shift(1)
-    df['High_prev']  = df['High'].shift(1)
+    o_prev, c_prev, h_prev = (np.concatenate(([np.nan], x[:-1])) for x in (o, c, h))
 
     # drop rows with NaNs in any of the above - but make a safety check first
-    prev_len = len(df)
-    df = df.dropna(subset=['IBS','Open_prev','Close_prev','High_prev'])
+    keep = ~(np.isnan(ibs) | np.isnan(o_prev) | np.isnan(c_prev) | np.isnan(h_prev))
+    df = df.take(np.flatnonzero(keep))
+    o, c, ibs, o_prev, c_prev, h_prev = (x[keep] for x in (o, c, ibs, o_prev, c_prev, h_prev))
     
     # If we lost all data after dropna, return empty dataframe with required columns
     if df.empty:
@@ -66,49 +92,28 @@ def generate_signals(df, ibs_limit: float = 0.3) -> pd.DataFrame:
 
     # raw buy/sell conditions
     buy_cond = (
-        (df['Close_prev'] > df['Open_prev'])   # yesterday bullish
-        & (df['Close'] < df['Open'])           # today bearish
-        & (df['Open'] > df['Close_prev'])      # engulfing
-        & (df['Close'] < df['Open_prev'])
-        & (df['IBS'] < ibs_limit)
+        (c_prev > o_prev)     # yesterday bullish
+        & (c < o)             # today bearish
+        & (o > c_prev)        # engulfing
+        & (c < o_prev)
+        & (ibs < ibs_limit)
     )
-    sell_cond = df['Close'] > df['High_prev']
-
-    # stateful signal generation
-    df['Signal'] = 0
-    in_position = False
-
-    for i in range(len(df)):
-        if not in_position and buy_cond.iloc[i]:
-            df['Signal'].iat[i] = 1
-            in_position = True
-        elif in_position and sell_cond.iloc[i]:
-            df['Signal'].iat[i] = -1
-            in_position = False
-        # else leave 0
-
-    # equity curve
-    df['EquityCurve'] = 1.0
-    in_position  = False
-    entry_price  = 0.0
-
-    for i in range(1, len(df)):
-        prev_sig = df['Signal'].iat[i-1]
-        prev_eq  = df['EquityCurve'].iat[i-1]
-        px       = df['Close'].iat[i-1]
-
-        if prev_sig == 1 and not in_position:
-            in_position = True
-            entry_price = px
-            df['EquityCurve'].iat[i] = prev_eq
-
-        elif prev_sig == -1 and in_position:
-            in_position = False
-            ret = (px - entry_price) / entry_price
-            df['EquityCurve'].iat[i] = prev_eq * (1 + ret)
-
-        else:
-            df['EquityCurve'].iat[i] = prev_eq
+    sell_cond = c > h_prev
+
+    # stateful signal generation (one pass over plain arrays, compiled when numba is installed)
+    df['Signal'] = _signals(buy_cond, sell_cond)
+
+    # equity curve: flat while in or out of a trade, with each trade's return booked on
+    # the bar after its sell - so it is a running product of per-bar growth factors
+    close  = df['Close'].to_numpy()
+    signal = df['Signal'].to_numpy()
+    entries = np.flatnonzero(signal == 1)   # buys and sells alternate, starting with a buy
+    exits   = np.flatnonzero(signal == -1)
+    exits   = exits[exits < len(df) - 1]    # a sell on the last bar is never booked
+    entry_price = close[entries[:len(exits)]]
+    growth = np.ones(len(df))
+    growth[exits + 1] = 1 + (close[exits] - entry_price) / entry_price
+    df['EquityCurve'] = np.cumprod(growth)
 
     # format output
     df = df.reset_index().rename(columns={'index': 'Date'})
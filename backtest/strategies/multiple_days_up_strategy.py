@@ -3,6 +3,99 @@
 import pandas as pd
 import numpy as np
 
+# numba is optional - without it the loops below run as plain Python
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _signal_loop(close, entry, exit_, start):
+    """Short on entry, short a second unit on a close above the first entry price, cover on exit.
+
+    Returns the Signal and Units arrays; bars before `start` are left flat.
+    """
+    n = len(close)
+    signal = np.zeros(n, dtype=np.int8)  # -1/0/1 fits in a byte
+    units = np.zeros(n, dtype=np.int8)  # never more than 2
+    entry_price = 0.0
+    in_position = False
+
+    for i in range(start, n):
+        # Default to previous units held
+        units[i] = units[i - 1]
+
+        # Check exit conditions first
+        if in_position and exit_[i]:
+            # Exit signal (cover all units)
+            signal[i] = 1
+            units[i] = 0
+            entry_price = 0.0
+            in_position = False
+            continue
+
+        # Initial entry condition
+        if not in_position and entry[i]:
+            # Short entry
+            signal[i] = -1
+            units[i] = 1
+            entry_price = close[i]
+            in_position = True
+            continue
+
+        # Aggressive version - add unit if price closes higher than initial entry
+        if in_position and close[i] > entry_price and units[i] == 1:
+            # Short another unit
+            signal[i] = -1
+            units[i] = 2
+    return signal, units
+
+
+_signals = njit(cache=True)(_signal_loop) if njit is not None else _signal_loop
+
+
+def _equity_loop(signal, close, units):
+    """Equity curve of the short units; each unit's return is compounded in when the position is covered."""
+    equity = np.ones(len(signal))
+    in_position = False
+    entry_prices = []  # List to track entry prices for multiple units
+    running_equity = 1.0
+
+    for i in range(1, len(signal)):
+        curr_signal = signal[i]
+        curr_price = close[i]
+        curr_units = units[i]
+        prev_units = units[i - 1]
+
+        equity[i] = running_equity
+
+        if curr_signal == -1:
+            # Enter or add to short position
+            in_position = True
+
+            # Handle initial position or adding units
+            if prev_units < curr_units:
+                # Add new unit(s)
+                for _ in range(curr_units - prev_units):
+                    entry_prices.append(curr_price)
+
+        elif curr_signal == 1 and in_position:
+            # Exit short position (all units)
+            in_position = False
+
+            # Calculate return on each unit and apply to equity
+            for entry_price in entry_prices:
+                ret = (entry_price - curr_price) / entry_price
+                running_equity *= (1 + ret)
+
+            # Reset tracking
+            entry_prices.clear()
+            equity[i] = running_equity
+    return equity
+
+
+_equity = njit(cache=True)(_equity_loop) if njit is not None else _equity_loop
+
 def generate_signals(df) -> pd.DataFrame:
     """
     Multiple Days Up (MDU) Short Strategy:
@@ -33,88 +126,26 @@ def generate_signals(df) -> pd.DataFrame:
     # 3) Drop rows with NaNs so everything lines up
     df.dropna(inplace=True)
     
-    # 4) Calculate days up out of last 5 days
-    df['DaysUpLast5'] = df['UpDay'].rolling(window=5).sum()
+    # 4) Calculate days up out of last 5 days, as differences of a running count of up days
+    # (the first 4 rows have no full window and stay at 0)
+    up_count = np.concatenate(([0], np.cumsum(df['UpDay'].to_numpy(dtype=np.int64))))
+    days_up_last5 = np.zeros(len(df), dtype=np.int8)
+    days_up_last5[4:] = up_count[5:] - up_count[:-5]
     
     # 5) Define entry and exit conditions
     below_ma200 = df['Close'] < df['MA200']
     above_ma5 = df['Close'] > df['MA5']
-    four_out_five_up = df['DaysUpLast5'] >= 4
+    four_out_five_up = days_up_last5 >= 4
     exit_ma5 = df['Close'] < df['MA5']
     exit_ma200 = df['Close'] > df['MA200']  # Common exit condition
     
-    # 6) Stateful signal generation
-    df['Signal'] = 0
-    df['Units'] = 0  # Track number of units in position
-    df['EntryPrice'] = 0.0  # Track entry price for aggressive version logic
-    
-    in_position = False
-    
-    for i in range(5, len(df)):  # Start at index 5 due to the 5-day lookback
-        # Default to previous units held and entry price
-        df['Units'].iat[i] = df['Units'].iat[i-1]
-        df['EntryPrice'].iat[i] = df['EntryPrice'].iat[i-1]
-        
-        # Check exit conditions first
-        if in_position and (exit_ma5.iloc[i] or exit_ma200.iloc[i]):
-            # Exit signal (cover all units)
-            df['Signal'].iat[i] = 1
-            df['Units'].iat[i] = 0
-            df['EntryPrice'].iat[i] = 0
-            in_position = False
-            continue
-        
-        # Initial entry condition
-        if not in_position and below_ma200.iloc[i] and four_out_five_up.iloc[i] and above_ma5.iloc[i]:
-            # Short entry
-            df['Signal'].iat[i] = -1
-            df['Units'].iat[i] = 1
-            df['EntryPrice'].iat[i] = df['Close'].iloc[i]
-            in_position = True
-            continue
-        
-        # Aggressive version - add unit if price closes higher than initial entry
-        if in_position and df['Close'].iloc[i] > df['EntryPrice'].iloc[i] and df['Units'].iat[i] == 1:
-            # Short another unit
-            df['Signal'].iat[i] = -1
-            df['Units'].iat[i] = 2
+    # 6) Stateful signal generation, tracking units held (start at index 5 due to the 5-day lookback)
+    entry = (below_ma200 & four_out_five_up & above_ma5).to_numpy()
+    exit_ = (exit_ma5 | exit_ma200).to_numpy()
+    df['Signal'], df['Units'] = _signals(df['Close'].to_numpy(), entry, exit_, 5)
     
     # 7) Calculate equity curve
-    df['EquityCurve'] = 1.0
-    in_position = False
-    entry_prices = []  # List to track entry prices for multiple units
-    running_equity = 1.0
-
-    for i in range(1, len(df)):
-        curr_signal = df['Signal'].iloc[i]
-        curr_price = df['Close'].iloc[i]
-        curr_units = df['Units'].iloc[i]
-        prev_units = df['Units'].iloc[i-1]
-        
-        df.loc[df.index[i], 'EquityCurve'] = running_equity
-        
-        if curr_signal == -1:
-            # Enter or add to short position
-            in_position = True
-            
-            # Handle initial position or adding units
-            if prev_units < curr_units:
-                # Add new unit(s)
-                for _ in range(curr_units - prev_units):
-                    entry_prices.append(curr_price)
-                
-        elif curr_signal == 1 and in_position:
-            # Exit short position (all units)
-            in_position = False
-            
-            # Calculate return on each unit and apply to equity
-            for entry_price in entry_prices:
-                ret = (entry_price - curr_price) / entry_price
-                running_equity *= (1 + ret)
-            
-            # Reset tracking
-            entry_prices = []
-            df.loc[df.index[i], 'EquityCurve'] = running_equity
+    df['EquityCurve'] = _equity(df['Signal'].to_numpy(), df['Close'].to_numpy(), df['Units'].to_numpy())
 
     # 8) Final formatting for return
     df = df.reset_index().rename(columns={'index': 'Date'})
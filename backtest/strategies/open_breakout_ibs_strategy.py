@@ -3,6 +3,42 @@
 import pandas as pd
 import numpy as np
 
+# numba is optional - without it the signal loop below runs as plain Python
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _signal_loop(buy, sell, time_stop):
+    """Buy while flat, sell on the breakout or after time_stop bars (time_stop < 0 = no stop)."""
+    signal = np.zeros(len(buy), dtype=np.int8)  # -1/0/1 fits in a byte
+    in_position = False
+    entry_idx = 0
+
+    for i in range(len(buy)):
+        if not in_position and buy[i]:
+            signal[i] = 1
+            in_position = True
+            entry_idx = i
+
+        elif in_position:
+            # time-stop exit
+            if time_stop >= 0 and (i - entry_idx) >= time_stop:
+                signal[i] = -1
+                in_position = False
+
+            # normal breakout exit
+            elif sell[i]:
+                signal[i] = -1
+                in_position = False
+
+        # otherwise leave Signal = 0
+    return signal
+
+
+_signals = njit(cache=True)(_signal_loop) if njit is not None else _signal_loop
+
 def generate_signals(df,
                      ibs_limit: float = 0.2,
                      time_stop: int  = None) -> pd.DataFrame:
@@ -46,56 +82,20 @@ def generate_signals(df,
     sell_cond = df['Close'] > df['high_prev']
 
     # signal generation with position & time-stop tracking
-    df['Signal'] = 0
-    in_position  = False
-    entry_idx    = None
-
-    for i in range(len(df)):
-        if not in_position and buy_cond.iloc[i]:
-            df['Signal'].iat[i] = 1
-            in_position         = True
-            entry_idx           = i
-
-        elif in_position:
-            # time-stop exit
-            if time_stop is not None and (i - entry_idx) >= time_stop:
-                df['Signal'].iat[i] = -1
-                in_position         = False
-                entry_idx           = None
-
-            # normal breakout exit
-            elif sell_cond.iloc[i]:
-                df['Signal'].iat[i] = -1
-                in_position         = False
-                entry_idx           = None
-
-        # otherwise leave Signal = 0
-
-    # equity curve calculation
-    df['EquityCurve'] = 1.0
-    in_position       = False
-    entry_price       = 0.0
-
-    for i in range(1, len(df)):
-        prev_sig = df['Signal'].iat[i-1]
-        prev_eq  = df['EquityCurve'].iat[i-1]
-        price    = df['Close'].iat[i-1]
-
-        # on buy
-        if prev_sig == 1 and not in_position:
-            in_position = True
-            entry_price = price
-            df['EquityCurve'].iat[i] = prev_eq
-
-        # on sell
-        elif prev_sig == -1 and in_position:
-            in_position = False
-            ret = (price - entry_price) / entry_price
-            df['EquityCurve'].iat[i] = prev_eq * (1 + ret)
-
-        # hold
-        else:
-            df['EquityCurve'].iat[i] = prev_eq
+    df['Signal'] = _signals(buy_cond.to_numpy(), sell_cond.to_numpy(),
+                            -1 if time_stop is None else time_stop)
+
+    # equity curve calculation: flat while holding or flat, with each trade's return
+    # booked on the bar after its sell - a running product of per-bar growth factors
+    close   = df['Close'].to_numpy()
+    signal  = df['Signal'].to_numpy()
+    entries = np.flatnonzero(signal == 1)   # buys and sells alternate, starting with a buy
+    exits   = np.flatnonzero(signal == -1)
+    exits   = exits[exits < len(df) - 1]    # a sell on the last bar is never booked
+    entry_price = close[entries[:len(exits)]]
+    growth  = np.ones(len(df))
+    growth[exits + 1] = 1 + (close[exits] - entry_price) / entry_price
+    df['EquityCurve'] = np.cumprod(growth)
 
     # format for backtester
     df = df.reset_index().rename(columns={'index': 'Date'})
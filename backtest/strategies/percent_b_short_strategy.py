@@ -3,125 +3,155 @@
 import pandas as pd
 import numpy as np
 
-def generate_signals(df) -> pd.DataFrame:
-    """
-    %b Short Strategy:
-      1) ETF closes below its 200-day MA
-      2) %b closes above 0.80 for 3 days in a row -> Short on close
-      3) Aggressive Version - Short another unit if %b is above 0.80 any additional day
-      4) Cover when %b closes under 0.20 or price closes above 200-day MA
+# numba is optional - without it the loops below run as plain Python
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
-    Returns:
-      DataFrame with columns [Date, Close, Signal, EquityCurve]
-    """
-    df = df.copy()
 
-    # 1) Ensure datetime index
-    if not isinstance(df.index, pd.DatetimeIndex):
-        df.index = pd.to_datetime(df.index)
+def _signal_loop(entry, exit_, add, start):
+    """Short on entry, short another unit on each `add` bar after the first day in, cover on exit.
 
-    # 2) Compute indicators
-    # 200-day moving average
-    df['MA200'] = df['Close'].rolling(window=200).mean()
-    
-    # Calculate Bollinger Bands and %b
-    window = 20
-    sma = df['Close'].rolling(window=window).mean()
-    std = df['Close'].rolling(window=window).std()
-    df['BollingerUpper'] = sma + 2 * std
-    df['BollingerLower'] = sma - 2 * std
-    df['percentB'] = (df['Close'] - df['BollingerLower']) / (df['BollingerUpper'] - df['BollingerLower'])
-    
-    # 3) Drop rows with NaNs so everything lines up
-    df.dropna(inplace=True)
-    
-    # 4) Define entry and exit conditions
-    below_ma200 = df['Close'] < df['MA200']
-    percentb_above_80_today = df['percentB'] > 0.80
-    percentb_above_80_yesterday = df['percentB'].shift(1) > 0.80
-    percentb_above_80_two_days_ago = df['percentB'].shift(2) > 0.80
-    percentb_above_80_three_days = percentb_above_80_today & percentb_above_80_yesterday & percentb_above_80_two_days_ago
-    
-    exit_percentb_below_20 = df['percentB'] < 0.20
-    exit_ma200 = df['Close'] > df['MA200']  # Common exit condition
-    
-    # 5) Stateful signal generation
-    df['Signal'] = 0
-    df['Units'] = 0  # Track number of units in position
-    df['DaysInPosition'] = 0  # Track days in position for aggressive version
-    
+    Returns the Signal and Units arrays; bars before `start` are left flat.
+    """
+    n = len(entry)
+    signal = np.zeros(n, dtype=np.int8)  # -1/0/1 fits in a byte
+    units = np.zeros(n, dtype=np.int16)  # one more per day %b stays high, so int8 could overflow
+    days_in_position = 0  # Days in position for aggressive version
     in_position = False
-    
-    for i in range(3, len(df)):  # Start at index 3 due to the 3-day lookback
+
+    for i in range(start, n):
         # Default to previous values
-        df['Units'].iat[i] = df['Units'].iat[i-1]
-        
+        units[i] = units[i - 1]
+
         # Update days in position counter
         if in_position:
-            df['DaysInPosition'].iat[i] = df['DaysInPosition'].iat[i-1] + 1
+            days_in_position += 1
         else:
-            df['DaysInPosition'].iat[i] = 0
-        
+            days_in_position = 0
+
         # Check exit conditions first
-        if in_position and (exit_percentb_below_20.iloc[i] or exit_ma200.iloc[i]):
+        if in_position and exit_[i]:
             # Exit signal (cover all units)
-            df['Signal'].iat[i] = 1
-            df['Units'].iat[i] = 0
+            signal[i] = 1
+            units[i] = 0
             in_position = False
             continue
-        
+
         # Initial entry condition
-        if not in_position and below_ma200.iloc[i] and percentb_above_80_three_days.iloc[i]:
+        if not in_position and entry[i]:
             # Short entry
-            df['Signal'].iat[i] = -1
-            df['Units'].iat[i] = 1
+            signal[i] = -1
+            units[i] = 1
             in_position = True
             continue
-        
+
         # Aggressive version - add unit if %b is above 0.80 any additional day in position
-        if in_position and percentb_above_80_today.iloc[i] and df['DaysInPosition'].iat[i] > 1:
+        if in_position and add[i] and days_in_position > 1:
             # Currently in position (not first day) and %b still above 0.80
-            df['Signal'].iat[i] = -1
-            df['Units'].iat[i] = df['Units'].iat[i-1] + 1
-    
-    # 6) Calculate equity curve
-    df['EquityCurve'] = 1.0
+            signal[i] = -1
+            units[i] = units[i - 1] + 1
+    return signal, units
+
+
+_signals = njit(cache=True)(_signal_loop) if njit is not None else _signal_loop
+
+
+def _equity_loop(signal, close, units):
+    """Equity curve of the short units; each unit's return is compounded in when the position is covered."""
+    equity = np.ones(len(signal))
     in_position = False
     entry_prices = []  # List to track entry prices for multiple units
     running_equity = 1.0
 
-    for i in range(1, len(df)):
-        curr_signal = df['Signal'].iloc[i]
-        curr_price = df['Close'].iloc[i]
-        curr_units = df['Units'].iloc[i]
-        prev_units = df['Units'].iloc[i-1]
-        
-        # Fix: Use loc instead of chained assignment
-        df.loc[df.index[i], 'EquityCurve'] = running_equity
-        
+    for i in range(1, len(signal)):
+        curr_signal = signal[i]
+        curr_price = close[i]
+        curr_units = units[i]
+        prev_units = units[i - 1]
+
+        equity[i] = running_equity
+
         if curr_signal == -1:
             # Enter or add to short position
             in_position = True
-            
+
             # Handle initial position or adding units
             if prev_units < curr_units:
                 # Add new unit(s)
                 for _ in range(curr_units - prev_units):
                     entry_prices.append(curr_price)
-                
+
         elif curr_signal == 1 and in_position:
             # Exit short position (all units)
             in_position = False
-            
+
             # Calculate return on each unit and apply to equity
             for entry_price in entry_prices:
                 ret = (entry_price - curr_price) / entry_price
                 running_equity *= (1 + ret)
-            
+
             # Reset tracking
-            entry_prices = []
-            # Fix: Use loc instead of chained assignment
-            df.loc[df.index[i], 'EquityCurve'] = running_equity
+            entry_prices.clear()
+            equity[i] = running_equity
+    return equity
+
+
+_equity = njit(cache=True)(_equity_loop) if njit is not None else _equity_loop
+
+def generate_signals(df) -> pd.DataFrame:
+    """
+    %b Short Strategy:
+      1) ETF closes below its 200-day MA
+      2) %b closes above 0.80 for 3 days in a row -> Short on close
+      3) Aggressive Version - Short another unit if %b is above 0.80 any additional day
+      4) Cover when %b closes under 0.20 or price closes above 200-day MA
+
+    Returns:
+      DataFrame with columns [Date, Close, Signal, EquityCurve]
+    """
+    df = df.copy()
+
+    # 1) Ensure datetime index
+    if not isinstance(df.index, pd.DatetimeIndex):
+        df.index = pd.to_datetime(df.index)
+
+    # 2) Compute indicators
+    # 200-day moving average
+    df['MA200'] = df['Close'].rolling(window=200).mean()
+    
+    # Calculate Bollinger Bands and %b (one 20-bar window serves both the mean and the std;
+    # the bands themselves are only needed for %b, so they don't become columns)
+    window = 20
+    rolling = df['Close'].rolling(window=window)
+    sma = rolling.mean()
+    std = rolling.std()
+    upper = sma + 2 * std
+    lower = sma - 2 * std
+    df['percentB'] = (df['Close'] - lower) / (upper - lower)
+    
+    # 3) Drop rows with NaNs so everything lines up
+    df.dropna(inplace=True)
+    
+    # 4) Define entry and exit conditions
+    below_ma200 = df['Close'] < df['MA200']
+    percentb_above_80_today = df['percentB'].to_numpy() > 0.80
+    # Today, yesterday and two days ago, from offset slices of the same mask (False for the first two rows)
+    percentb_above_80_three_days = np.zeros(len(df), dtype=bool)
+    percentb_above_80_three_days[2:] = (percentb_above_80_today[2:] & percentb_above_80_today[1:-1]
+                                        & percentb_above_80_today[:-2])
+    
+    exit_percentb_below_20 = df['percentB'] < 0.20
+    exit_ma200 = df['Close'] > df['MA200']  # Common exit condition
+    
+    # 5) Stateful signal generation, tracking units held (start at index 3 due to the 3-day lookback)
+    entry = (below_ma200 & percentb_above_80_three_days).to_numpy()
+    exit_ = (exit_percentb_below_20 | exit_ma200).to_numpy()
+    df['Signal'], df['Units'] = _signals(entry, exit_, percentb_above_80_today, 3)
+    
+    # 6) Calculate equity curve
+    df['EquityCurve'] = _equity(df['Signal'].to_numpy(), df['Close'].to_numpy(), df['Units'].to_numpy())
 
     # 7) Final formatting for return
     df = df.reset_index().rename(columns={'index': 'Date'})
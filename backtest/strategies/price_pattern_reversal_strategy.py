@@ -2,6 +2,100 @@
 
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# numba is optional - without it the loops below run as plain Python
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _signal_loop(close, entry, exit_, start):
+    """Short on entry, short a second unit on a close above the first entry price, cover on exit.
+
+    Returns the Signal and Units arrays; bars before `start` are left flat.
+    """
+    n = len(close)
+    signal = np.zeros(n, dtype=np.int8)  # -1/0/1 fits in a byte
+    units = np.zeros(n, dtype=np.int8)  # never more than 2
+    entry_price = 0.0
+    in_position = False
+
+    for i in range(start, n):
+        # Default to previous units held
+        units[i] = units[i - 1]
+
+        # Check exit conditions first
+        if in_position and exit_[i]:
+            # Exit signal (cover all units)
+            signal[i] = 1
+            units[i] = 0
+            entry_price = 0.0
+            in_position = False
+            continue
+
+        # Initial entry condition
+        if not in_position and entry[i]:
+            # Short entry
+            signal[i] = -1
+            units[i] = 1
+            entry_price = close[i]
+            in_position = True
+            continue
+
+        # Aggressive version - add unit if price closes higher than initial entry
+        if in_position and close[i] > entry_price and units[i] == 1:
+            # Short another unit
+            signal[i] = -1
+            units[i] = 2
+    return signal, units
+
+
+_signals = njit(cache=True)(_signal_loop) if njit is not None else _signal_loop
+
+
+def _equity_loop(signal, close, units):
+    """Equity curve of the short units; each unit's return is compounded in when the position is covered."""
+    equity = np.ones(len(signal))
+    in_position = False
+    entry_prices = []  # List to track entry prices for multiple units
+    running_equity = 1.0
+
+    for i in range(1, len(signal)):
+        curr_signal = signal[i]
+        curr_price = close[i]
+        curr_units = units[i]
+        prev_units = units[i - 1]
+
+        equity[i] = running_equity
+
+        if curr_signal == -1:
+            # Enter or add to short position
+            in_position = True
+
+            # Handle initial position or adding units
+            if prev_units < curr_units:
+                # Add new unit(s)
+                for _ in range(curr_units - prev_units):
+                    entry_prices.append(curr_price)
+
+        elif curr_signal == 1 and in_position:
+            # Exit short position (all units)
+            in_position = False
+
+            # Calculate return on each unit and apply to equity
+            for entry_price in entry_prices:
+                ret = (entry_price - curr_price) / entry_price
+                running_equity *= (1 + ret)
+
+            # Reset tracking
+            entry_prices.clear()
+            equity[i] = running_equity
+    return equity
+
+
+_equity = njit(cache=True)(_equity_loop) if njit is not None else _equity_loop
 
 def generate_signals(df) -> pd.DataFrame:
     """
@@ -31,102 +125,33 @@ def generate_signals(df) -> pd.DataFrame:
     # 3) Drop rows with NaNs so everything lines up
     df.dropna(inplace=True)
     
-    # 4) Create shift columns for high/low price comparisons
-    df['High_Prev'] = df['High'].shift(1)
-    df['Low_Prev'] = df['Low'].shift(1)
-    df['High_2Prev'] = df['High'].shift(2)
-    df['Low_2Prev'] = df['Low'].shift(2)
-    df['High_3Prev'] = df['High'].shift(3)
-    df['Low_3Prev'] = df['Low'].shift(3)
+    # 4) Check if high and low are both above the previous day's, for today and the two days
+    # before: each 4-bar sliding window (a view, no copies) must rise bar over bar.
+    # The first 3 rows have no full window and stay False
+    highs_and_lows_rising = np.zeros(len(df), dtype=bool)
+    if len(df) >= 4:
+        high_windows = sliding_window_view(df['High'].to_numpy(), 4)
+        low_windows = sliding_window_view(df['Low'].to_numpy(), 4)
+        highs_and_lows_rising[3:] = ((high_windows[:, 1:] > high_windows[:, :-1]).all(axis=1)
+                                     & (low_windows[:, 1:] > low_windows[:, :-1]).all(axis=1))
     
     # 5) Define entry and exit conditions
     below_ma200 = df['Close'] < df['MA200']
     above_ma5 = df['Close'] > df['MA5']
     
-    # Check if high and low are both above the previous day's
-    day2_above_day3 = (df['High_2Prev'] > df['High_3Prev']) & (df['Low_2Prev'] > df['Low_3Prev'])
-    day1_above_day2 = (df['High_Prev'] > df['High_2Prev']) & (df['Low_Prev'] > df['Low_2Prev'])
-    day0_above_day1 = (df['High'] > df['High_Prev']) & (df['Low'] > df['Low_Prev'])
-    
     # Combined entry condition
-    entry_condition = below_ma200 & above_ma5 & day2_above_day3 & day1_above_day2 & day0_above_day1
+    entry_condition = below_ma200 & above_ma5 & highs_and_lows_rising
     
     # Exit conditions
     exit_ma5 = df['Close'] < df['MA5']
     exit_ma200 = df['Close'] > df['MA200']  # Common exit condition
     
-    # 6) Stateful signal generation
-    df['Signal'] = 0
-    df['Units'] = 0  # Track number of units in position
-    df['EntryPrice'] = 0.0  # Track entry price for aggressive version
-    
-    in_position = False
-    
-    for i in range(3, len(df)):  # Start at index 3 due to the lookbacks
-        # Default to previous values
-        df['Units'].iat[i] = df['Units'].iat[i-1]
-        df['EntryPrice'].iat[i] = df['EntryPrice'].iat[i-1]
-        
-        # Check exit conditions first
-        if in_position and (exit_ma5.iloc[i] or exit_ma200.iloc[i]):
-            # Exit signal (cover all units)
-            df['Signal'].iat[i] = 1
-            df['Units'].iat[i] = 0
-            df['EntryPrice'].iat[i] = 0
-            in_position = False
-            continue
-        
-        # Initial entry condition
-        if not in_position and entry_condition.iloc[i]:
-            # Short entry
-            df['Signal'].iat[i] = -1
-            df['Units'].iat[i] = 1
-            df['EntryPrice'].iat[i] = df['Close'].iloc[i]
-            in_position = True
-            continue
-        
-        # Aggressive version - add unit if price closes higher than initial entry
-        if in_position and df['Close'].iloc[i] > df['EntryPrice'].iloc[i] and df['Units'].iat[i] == 1:
-            # Short another unit
-            df['Signal'].iat[i] = -1
-            df['Units'].iat[i] = 2
+    # 6) Stateful signal generation, tracking units held (start at index 3 due to the lookbacks)
+    exit_ = (exit_ma5 | exit_ma200).to_numpy()
+    df['Signal'], df['Units'] = _signals(df['Close'].to_numpy(), entry_condition.to_numpy(), exit_, 3)
     
     # 7) Calculate equity curve
-    df['EquityCurve'] = 1.0
-    in_position = False
-    entry_prices = []  # List to track entry prices for multiple units
-    running_equity = 1.0
-
-    for i in range(1, len(df)):
-        curr_signal = df['Signal'].iloc[i]
-        curr_price = df['Close'].iloc[i]
-        curr_units = df['Units'].iloc[i]
-        prev_units = df['Units'].iloc[i-1]
-        
-        df.loc[df.index[i], 'EquityCurve'] = running_equity
-        
-        if curr_signal == -1:
-            # Enter or add to short position
-            in_position = True
-            
-            # Handle initial position or adding units
-            if prev_units < curr_units:
-                # Add new unit(s)
-                for _ in range(curr_units - prev_units):
-                    entry_prices.append(curr_price)
-                
-        elif curr_signal == 1 and in_position:
-            # Exit short position (all units)
-            in_position = False
-            
-            # Calculate return on each unit and apply to equity
-            for entry_price in entry_prices:
-                ret = (entry_price - curr_price) / entry_price
-                running_equity *= (1 + ret)
-            
-            # Reset tracking
-            entry_prices = []
-            df.loc[df.index[i], 'EquityCurve'] = running_equity
+    df['EquityCurve'] = _equity(df['Signal'].to_numpy(), df['Close'].to_numpy(), df['Units'].to_numpy())
 
     # 8) Final formatting for return
     df = df.reset_index().rename(columns={'index': 'Date'})